@@ -21,6 +21,7 @@ from .restaurant import query_restaurants
 from .search import SearchRequest
 from .search import SearchResponse
 from .suggest import AreaSuggestion
+from .suggest import SuggestionSession
 from .suggest import get_area_suggestions
 from .suggest import get_area_suggestions_async
 from .types import ReservationDate
@@ -47,6 +48,7 @@ __all__ = [
     "SearchRequest",
     "SearchResponse",
     "SortType",
+    "SuggestionSession",
     "TabelogError",
     "get_all_genres",
     "get_area_suggestions",
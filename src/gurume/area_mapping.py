@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 # Prefecture mapping.
 PREFECTURE_MAPPING = {
     # Hokkaido and Tohoku.
@@ -87,18 +91,17 @@ for full_name, slug in PREFECTURE_MAPPING.items():
             break
 
 
-def _lookup_area_path(area_name: str) -> str | None:
-    if area_name in PREFECTURE_MAPPING:
-        return PREFECTURE_MAPPING[area_name]
-    if area_name in CITY_MAPPING:
-        return CITY_MAPPING[area_name]
-    if area_name in CITY_AREA_PATH_MAPPING:
-        return CITY_AREA_PATH_MAPPING[area_name]
-    if area_name in _PREFIX_TO_SLUG:
-        return _PREFIX_TO_SLUG[area_name]
-    return None
+# Every exact-match alias in a single table. Later mappings take priority, so
+# full prefecture names win over city names, city paths, and bare prefixes.
+_AREA_SLUGS: Mapping[str, str] = MappingProxyType(
+    {**_PREFIX_TO_SLUG, **CITY_AREA_PATH_MAPPING, **CITY_MAPPING, **PREFECTURE_MAPPING}
+)
+
+# Single-character prefecture/city suffixes that may be dropped for a second lookup.
+_AREA_SUFFIXES = frozenset("都府県市")
 
 
+@lru_cache(maxsize=512)
 def get_area_slug(area_name: str) -> str | None:
     """
     Convert an area name to a Tabelog URL slug or path.
@@ -110,13 +113,13 @@ def get_area_slug(area_name: str) -> str | None:
         URL slug/path, for example "tokyo", "mie", or "hokkaido/A0101"; otherwise None.
     """
     # Check full names, city names, city-level paths, and prefecture-name prefixes first.
-    area_path = _lookup_area_path(area_name)
+    area_path = _AREA_SLUGS.get(area_name)
     if area_path:
         return area_path
 
-    # Remove prefecture/city suffixes, then try again.
-    for suffix in ["都", "府", "県", "市"]:
-        if area_name.endswith(suffix):
-            return _lookup_area_path(area_name[: -len(suffix)])
+    # Remove a single prefecture/city suffix, then try again. Stripping only one character
+    # keeps names like "京都市" resolving via "京都" instead of collapsing to "京".
+    if area_name and area_name[-1] in _AREA_SUFFIXES:
+        return _AREA_SLUGS.get(area_name[:-1])
 
     return None
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from collections.abc import Sequence
 from enum import StrEnum
+from operator import attrgetter
 from typing import Annotated
 
 import typer
@@ -32,6 +34,7 @@ class OutputFormat(StrEnum):
 
     TABLE = "table"
     JSON = "json"
+    JSONL = "jsonl"
     SIMPLE = "simple"
 
 
@@ -76,20 +79,17 @@ def _resolve_genre_code(
     return None, keyword
 
 
+_JSON_FIELDS = ("name", "rating", "review_count", "area", "genres", "url", "lunch_price", "dinner_price")
+_get_json_values = attrgetter(*_JSON_FIELDS)
+
+
+def _iter_json_data(restaurants: Sequence) -> Iterator[dict[str, object]]:
+    for r in restaurants:
+        yield dict(zip(_JSON_FIELDS, _get_json_values(r), strict=True))
+
+
 def _build_json_data(restaurants: Sequence) -> list[dict[str, object]]:
-    return [
-        {
-            "name": r.name,
-            "rating": r.rating,
-            "review_count": r.review_count,
-            "area": r.area,
-            "genres": r.genres,
-            "url": r.url,
-            "lunch_price": r.lunch_price,
-            "dinner_price": r.dinner_price,
-        }
-        for r in restaurants
-    ]
+    return list(_iter_json_data(restaurants))
 
 
 @app.command()
@@ -100,6 +100,7 @@ def search(
     sort: Annotated[SortOption, typer.Option("--sort", "-s", help="排序方式")] = SortOption.RANKING,
     limit: Annotated[int, typer.Option("--limit", "-n", min=1, help="顯示結果數量")] = 20,
     output: Annotated[OutputFormat, typer.Option("--output", "-o", help="輸出格式")] = OutputFormat.TABLE,
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="略過快取，強制重新抓取")] = False,
 ) -> None:
     """Search restaurants.
 
@@ -108,7 +109,7 @@ def search(
       gurume search -a 三重 -c すき焼き --sort ranking
       gurume search --area 大阪 --cuisine ラーメン -o json
     """
-    status_console = err_console if output == OutputFormat.JSON else console
+    status_console = err_console if output in (OutputFormat.JSON, OutputFormat.JSONL) else console
 
     if not area and not keyword and not cuisine:
         status_console.print("[red]錯誤：至少需要提供地區、關鍵字或料理類別之一[/red]")
@@ -129,7 +130,7 @@ def search(
         max_pages=1,
     )
 
-    response = request.search_sync()
+    response = request.search_sync(use_cache=not no_cache)
 
     if response.status.value == "error":
         status_console.print(f"[red]搜尋錯誤：{response.error_message}[/red]")
@@ -145,6 +146,8 @@ def search(
     # Output results.
     if output == OutputFormat.JSON:
         _output_json(restaurants)
+    elif output == OutputFormat.JSONL:
+        _output_jsonl(restaurants)
     elif output == OutputFormat.SIMPLE:
         _output_simple(restaurants)
     else:
@@ -166,10 +169,10 @@ def _output_table(restaurants: list) -> None:
     for r in restaurants:
         table.add_row(
             r.name,
-            f"{r.rating:.2f}" if r.rating else "N/A",
-            str(r.review_count) if r.review_count else "N/A",
-            r.area or "N/A",
-            ", ".join(r.genres[:2]) if r.genres else "N/A",
+            r.rating_text,
+            r.review_count_text,
+            r.area_text,
+            r.short_genres,
         )
 
     console.print(table)
@@ -177,15 +180,22 @@ def _output_table(restaurants: list) -> None:
 
 def _output_json(restaurants: list) -> None:
     """Output restaurants as JSON."""
-    console.print(json.dumps(_build_json_data(restaurants), ensure_ascii=False, indent=2))
+    # Write the encoded document as-is: console.print() would run it through
+    # markup parsing, highlighting and line wrapping, which is slow on large
+    # payloads and can corrupt names containing brackets or long strings.
+    console.out(json.dumps(_build_json_data(restaurants), ensure_ascii=False, indent=2), highlight=False)
+
+
+def _output_jsonl(restaurants: list) -> None:
+    """Output restaurants as newline-delimited JSON, one object per line."""
+    for item in _iter_json_data(restaurants):
+        console.out(json.dumps(item, ensure_ascii=False), highlight=False)
 
 
 def _output_simple(restaurants: list) -> None:
     """Output restaurants in a simple text format."""
     for i, r in enumerate(restaurants, 1):
-        rating_str = f"{r.rating:.2f}" if r.rating else "N/A"
-        review_str = str(r.review_count) if r.review_count else "N/A"
-        console.print(f"{i}. {r.name} - ⭐{rating_str} ({review_str} 評論)")
+        console.print(f"{i}. {r.name} - ⭐{r.rating_text} ({r.review_count_text} 評論)")
         if r.area:
             console.print(f"   地區: {r.area}")
         if r.genres:
@@ -78,6 +78,12 @@ CUISINE_SLUG_MAPPING = {
     "スイーツ": "sweets",
 }
 
+# Cuisine names in display order; dict keys are already unique, so only sort once.
+_SORTED_GENRES = tuple(sorted(GENRE_CODE_MAPPING))
+
+# Reverse index for code -> name lookups; codes are unique across the mapping.
+_CODE_TO_GENRE = {code: name for name, code in GENRE_CODE_MAPPING.items()}
+
 
 def get_genre_code(genre_name: str) -> str | None:
     """
@@ -102,10 +108,7 @@ def get_genre_name_by_code(genre_code: str) -> str | None:
     Returns:
         Cuisine name, or None.
     """
-    for name, code in GENRE_CODE_MAPPING.items():
-        if code == genre_code:
-            return name
-    return None
+    return _CODE_TO_GENRE.get(genre_code)
 
 
 def get_cuisine_slug(genre_name: str) -> str | None:
@@ -128,5 +131,5 @@ def get_all_genres() -> list[str]:
     Returns:
         List of cuisine names.
     """
-    # Remove duplicates.
-    return sorted(set(GENRE_CODE_MAPPING.keys()))
+    # Copy so callers can mutate the result without touching the shared order.
+    return list(_SORTED_GENRES)
@@ -0,0 +1,49 @@
+"""Shared HTTP client for long-running callers
+
+Every new connection to Tabelog pays a TCP and TLS handshake. Processes that
+issue many requests over their lifetime, such as the MCP server, reuse one
+pooled ``httpx.AsyncClient`` instead of opening a client per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+
+import httpx
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+# Pooled connections are bound to the event loop that opened them, so keep one
+# client per loop rather than a single process-wide instance.
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the shared client for the running event loop, creating it on first use
+
+    Returns:
+        Pooled async client with redirects and HTTP/2 enabled
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            http2=True,
+            limits=DEFAULT_LIMITS,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the shared client for the running event loop, if one was created"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -30,6 +30,9 @@ ITEM_PARSE_EXCEPTIONS = (AttributeError, TypeError, ValueError)
 # This pattern excludes magazine articles, promotional pages, and other non-restaurant links.
 _RESTAURANT_URL_RE = re.compile(r"/A\d+/A\d+/\d+")
 
+# Placeholder shown by the CLI and TUI for fields Tabelog did not provide.
+NOT_AVAILABLE = "N/A"
+
 
 def build_search_url_and_params(
     params: dict[str, Any],
@@ -112,7 +115,7 @@ class PriceRange(StrEnum):
     DINNER_OVER_30000 = "C012"  # Dinner: ￥30,000 and up.
 
 
-@dataclass
+@dataclass(slots=True)
 class Restaurant:
     """Restaurant information."""
 
@@ -137,6 +140,26 @@ class Restaurant:
     has_reservation: bool = False
     image_urls: list[str] = field(default_factory=list)
 
+    @property
+    def rating_text(self) -> str:
+        """Rating with two decimals for display, or "N/A" when unknown."""
+        return f"{self.rating:.2f}" if self.rating else NOT_AVAILABLE
+
+    @property
+    def review_count_text(self) -> str:
+        """Review count for display, or "N/A" when unknown."""
+        return str(self.review_count) if self.review_count else NOT_AVAILABLE
+
+    @property
+    def area_text(self) -> str:
+        """Area for display, or "N/A" when unknown."""
+        return self.area or NOT_AVAILABLE
+
+    @property
+    def short_genres(self) -> str:
+        """First two genres joined for compact table cells, or "N/A" when unknown."""
+        return ", ".join(self.genres[:2]) if self.genres else NOT_AVAILABLE
+
 
 @dataclass
 class RestaurantSearchRequest:
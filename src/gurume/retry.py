@@ -12,6 +12,8 @@ Features:
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 from loguru import logger
 from tenacity import retry
@@ -183,8 +185,6 @@ async def fetch_with_retry_async(
             if attempt < max_attempts:
                 wait_time = min(min_wait * (2 ** (attempt - 1)), max_wait)
                 logger.warning(f"Retry attempt {attempt}/{max_attempts} after {e.__class__.__name__}")
-                import asyncio
-
                 await asyncio.sleep(wait_time)
             else:
                 logger.error(f"All {max_attempts} retry attempts failed")
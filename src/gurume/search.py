@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import json
 import re
+from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
 from collections.abc import Callable
 from dataclasses import asdict
 from dataclasses import dataclass
@@ -15,6 +18,8 @@ import httpx
 from bs4 import BeautifulSoup
 
 from .area_mapping import get_area_slug
+from .cache import MemoryCache
+from .cache import generate_cache_key
 from .restaurant import Restaurant
 from .restaurant import RestaurantSearchRequest
 from .restaurant import SortType
@@ -22,14 +27,39 @@ from .restaurant import build_search_url_and_params
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 SEARCH_EXCEPTIONS = (httpx.HTTPError, RuntimeError, ValueError, TypeError)
+SEARCH_CACHE_TTL = 120.0  # short, so long-running MCP and TUI sessions see fresh ratings
+SEARCH_CACHE_MAX_SIZE = 32
+
+# Result pages get their own small cache rather than the global response cache:
+# entries carry a full HTML page, and long-lived processes should not pin
+# hundreds of them. Parsed restaurants are kept alongside to skip re-parsing.
+_PAGE_CACHE = MemoryCache(default_ttl=SEARCH_CACHE_TTL, max_size=SEARCH_CACHE_MAX_SIZE)
 
 
 def _now() -> datetime:
     return datetime.now(UTC)
 
 
+def _cached_page(url: str, params: dict[str, str]) -> tuple[str, list[Restaurant]] | None:
+    cached = _PAGE_CACHE.get(generate_cache_key(url, params))
+    if cached is None:
+        return None
+    html, restaurants = cached
+    return html, list(restaurants)
+
+
+def _store_page(url: str, params: dict[str, str], html: str, restaurants: list[Restaurant]) -> None:
+    _PAGE_CACHE.set(generate_cache_key(url, params), (html, list(restaurants)))
+
+
+def clear_search_cache() -> None:
+    """Drop every cached search result page."""
+    _PAGE_CACHE.clear()
+
+
 def _reraise_if_fatal(error: BaseException) -> None:
-    if isinstance(error, KeyboardInterrupt | SystemExit):
+    # Cancellation must propagate unchanged so callers' timeouts and task groups still work.
+    if isinstance(error, KeyboardInterrupt | SystemExit | asyncio.CancelledError):
         raise error
 
 
@@ -79,16 +109,13 @@ class SearchResponse:
         Returns:
             New SearchResponse containing the filtered restaurants.
         """
-        filtered = self.restaurants
-
-        if min_rating is not None:
-            filtered = [r for r in filtered if r.rating and r.rating >= min_rating]
-
-        if min_review_count is not None:
-            filtered = [r for r in filtered if r.review_count and r.review_count >= min_review_count]
-
-        if condition is not None:
-            filtered = [r for r in filtered if condition(r)]
+        filtered = [
+            r
+            for r in self.restaurants
+            if (min_rating is None or (r.rating and r.rating >= min_rating))
+            and (min_review_count is None or (r.review_count and r.review_count >= min_review_count))
+            and (condition is None or condition(r))
+        ]
 
         return SearchResponse(
             status=self.status,
@@ -167,7 +194,7 @@ class SearchResponse:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchRequest:
     """Generic search request that extends RestaurantSearchRequest."""
 
@@ -185,6 +212,7 @@ class SearchRequest:
     max_pages: int = 1
     include_meta: bool = True
     timeout: float = 30.0
+    max_concurrency: int = 5
 
     def _parse_meta(self, html: str, current_page: int) -> SearchMeta:
         """Parse search metadata."""
@@ -309,10 +337,18 @@ class SearchRequest:
             self.max_pages = remaining_pages
         return meta
 
-    def _search_page_sync(self, request: RestaurantSearchRequest) -> tuple[str, list[Restaurant]]:
+    def _search_page_sync(
+        self,
+        client: httpx.Client,
+        request: RestaurantSearchRequest,
+        use_cache: bool = True,
+    ) -> tuple[str, list[Restaurant]]:
         url, params = self._build_url_and_params(request)
+        if use_cache and (cached := _cached_page(url, params)) is not None:
+            return cached
+
         try:
-            resp = httpx.get(
+            resp = client.get(
                 url=url,
                 params=params,
                 headers=self._build_headers(),
@@ -323,44 +359,81 @@ class SearchRequest:
         except BaseException as e:
             _reraise_if_fatal(e)
             raise RuntimeError(str(e)) from e
-        else:
-            return resp.text, request._parse_restaurants(resp.text)
+
+        restaurants = request._parse_restaurants(resp.text)
+        if use_cache:
+            _store_page(url, params, resp.text, restaurants)
+        return resp.text, restaurants
 
     async def _search_page_async(
         self,
         client: httpx.AsyncClient,
         request: RestaurantSearchRequest,
+        use_cache: bool = True,
     ) -> tuple[str, list[Restaurant]]:
         url, params = self._build_url_and_params(request)
+        if use_cache and (cached := _cached_page(url, params)) is not None:
+            return cached
+
         try:
-            resp = await client.get(url=url, params=params, headers=self._build_headers())
+            resp = await client.get(
+                url=url,
+                params=params,
+                headers=self._build_headers(),
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
             resp.raise_for_status()
         except BaseException as e:
             _reraise_if_fatal(e)
             raise RuntimeError(str(e)) from e
-        else:
-            return resp.text, request._parse_restaurants(resp.text)
 
-    def search_sync(self) -> SearchResponse:
-        """Run the search synchronously."""
-        try:
-            all_restaurants: list[Restaurant] = []
-            meta = None
+        restaurants = request._parse_restaurants(resp.text)
+        if use_cache:
+            _store_page(url, params, resp.text, restaurants)
+        return resp.text, restaurants
 
-            start_page = self.page
-            end_page = self.page + self.max_pages
+    def _collect_pages_sync(
+        self,
+        client: httpx.Client,
+        use_cache: bool,
+    ) -> tuple[list[Restaurant], SearchMeta | None]:
+        all_restaurants: list[Restaurant] = []
+        meta = None
+
+        start_page = self.page
+        end_page = self.page + self.max_pages
+
+        for page in range(start_page, end_page):
+            request = self._create_restaurant_request(page)
+            html, restaurants = self._search_page_sync(client, request, use_cache)
+            all_restaurants.extend(restaurants)
+            meta = self._update_meta(meta, html, page)
+            if meta and meta.total_count == 0:
+                break
+
+            # Stop when the current page has no results.
+            if not restaurants:
+                break
 
-            for page in range(start_page, end_page):
-                request = self._create_restaurant_request(page)
-                html, restaurants = self._search_page_sync(request)
-                all_restaurants.extend(restaurants)
-                meta = self._update_meta(meta, html, page)
-                if meta and meta.total_count == 0:
-                    break
+        return all_restaurants, meta
 
-                # Stop when the current page has no results.
-                if not restaurants:
-                    break
+    def search_sync(self, client: httpx.Client | None = None, use_cache: bool = True) -> SearchResponse:
+        """Run the search synchronously.
+
+        Args:
+            client: Optional client to reuse across searches. When omitted, a
+                client is created for this search so every page shares one
+                connection pool.
+            use_cache: Whether to read and store result pages in the search
+                page cache. Defaults to True.
+        """
+        try:
+            if client is None:
+                with httpx.Client(timeout=self.timeout, follow_redirects=True, http2=True) as owned_client:
+                    all_restaurants, meta = self._collect_pages_sync(owned_client, use_cache)
+            else:
+                all_restaurants, meta = self._collect_pages_sync(client, use_cache)
 
             status = SearchStatus.SUCCESS if all_restaurants else SearchStatus.NO_RESULTS
         except SEARCH_EXCEPTIONS as e:
@@ -375,27 +448,99 @@ class SearchRequest:
                 meta=meta,
             )
 
-    async def search(self) -> SearchResponse:
-        """Run the search asynchronously."""
+    async def _iter_pages_async(
+        self,
+        client: httpx.AsyncClient,
+        use_cache: bool,
+    ) -> AsyncGenerator[tuple[list[Restaurant], SearchMeta | None], None]:
+        # An empty page range sends nothing, matching _collect_pages_sync.
+        if self.max_pages <= 0:
+            return
+
+        # The first page decides how many pages exist, so fetch it alone and
+        # then request the rest of the range concurrently.
+        html, restaurants = await self._search_page_async(client, self._create_restaurant_request(self.page), use_cache)
+        meta = self._update_meta(None, html, self.page)
+        yield restaurants, meta
+        if (meta and meta.total_count == 0) or not restaurants:
+            return
+
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def fetch_page(page: int) -> tuple[str, list[Restaurant]]:
+            async with semaphore:
+                return await self._search_page_async(client, self._create_restaurant_request(page), use_cache)
+
+        tasks = [asyncio.create_task(fetch_page(page)) for page in range(self.page + 1, self.page + self.max_pages)]
+        try:
+            # Hand pages back in order as soon as each one and its predecessors are done.
+            for task in tasks:
+                _, page_restaurants = await task
+                # Stop at the first page without results, as a sequential crawl would.
+                if not page_restaurants:
+                    return
+                yield page_restaurants, meta
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _collect_pages_async(
+        self,
+        client: httpx.AsyncClient,
+        use_cache: bool,
+    ) -> tuple[list[Restaurant], SearchMeta | None]:
+        all_restaurants: list[Restaurant] = []
+        meta = None
+        async for restaurants, page_meta in self._iter_pages_async(client, use_cache):
+            all_restaurants.extend(restaurants)
+            meta = page_meta
+        return all_restaurants, meta
+
+    async def stream(
+        self,
+        client: httpx.AsyncClient | None = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[list[Restaurant]]:
+        """Yield restaurants page by page as soon as each page is available.
+
+        Pages arrive in order and the iteration stops at the first empty page,
+        so the concatenated output matches ``search()``.
+
+        Args:
+            client: Optional client to reuse across searches. When omitted, a
+                client is created for this search and closed afterwards.
+            use_cache: Whether to read and store result pages in the search
+                page cache. Defaults to True.
+
+        Raises:
+            RuntimeError: If a page request fails.
+        """
+        async with contextlib.AsyncExitStack() as stack:
+            if client is None:
+                client = await stack.enter_async_context(
+                    httpx.AsyncClient(timeout=self.timeout, follow_redirects=True, http2=True)
+                )
+            async with contextlib.aclosing(self._iter_pages_async(client, use_cache)) as pages:
+                async for restaurants, _ in pages:
+                    if restaurants:
+                        yield restaurants
+
+    async def search(self, client: httpx.AsyncClient | None = None, use_cache: bool = True) -> SearchResponse:
+        """Run the search asynchronously.
+
+        Args:
+            client: Optional client to reuse across searches. When omitted, a
+                client is created for this search and closed afterwards.
+            use_cache: Whether to read and store result pages in the search
+                page cache. Defaults to True.
+        """
         try:
-            all_restaurants: list[Restaurant] = []
-            meta = None
-
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                start_page = self.page
-                end_page = self.page + self.max_pages
-
-                for page in range(start_page, end_page):
-                    request = self._create_restaurant_request(page)
-                    html, restaurants = await self._search_page_async(client, request)
-                    all_restaurants.extend(restaurants)
-                    meta = self._update_meta(meta, html, page)
-                    if meta and meta.total_count == 0:
-                        break
-
-                    # Stop when the current page has no results.
-                    if not restaurants:
-                        break
+            if client is None:
+                async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True, http2=True) as owned_client:
+                    all_restaurants, meta = await self._collect_pages_async(owned_client, use_cache)
+            else:
+                all_restaurants, meta = await self._collect_pages_async(client, use_cache)
 
             status = SearchStatus.SUCCESS if all_restaurants else SearchStatus.NO_RESULTS
         except SEARCH_EXCEPTIONS as e:
@@ -6,6 +6,8 @@ delegating response schemas and helper logic to focused modules.
 
 from __future__ import annotations
 
+import asyncio
+from functools import cache
 from typing import Annotated
 from typing import Literal
 
@@ -16,8 +18,10 @@ from pydantic import Field
 from .detail import RestaurantDetailRequest
 from .genre_mapping import get_all_genres
 from .genre_mapping import get_genre_code
+from .http_client import get_async_client
 from .search import SearchRequest
 from .search import SearchStatus
+from .server_helpers import _build_combined_suggestion_output
 from .server_helpers import _build_cuisine_list_error_output
 from .server_helpers import _build_cuisine_list_output
 from .server_helpers import _build_detail_error_output
@@ -33,6 +37,7 @@ from .server_helpers import _to_restaurant_outputs
 from .server_helpers import _to_suggestion_outputs
 from .server_helpers import _validate_detail_params
 from .server_helpers import _validate_search_params
+from .server_models import CombinedSuggestionOutput
 from .server_models import CourseOutput
 from .server_models import CuisineListOutput
 from .server_models import CuisineOutput
@@ -52,6 +57,7 @@ from .suggest import get_area_suggestions_async
 from .suggest import get_keyword_suggestions_async
 
 __all__ = [
+    "CombinedSuggestionOutput",
     "CourseOutput",
     "CuisineListOutput",
     "CuisineOutput",
@@ -72,6 +78,7 @@ __all__ = [
     "tabelog_get_area_suggestions",
     "tabelog_get_keyword_suggestions",
     "tabelog_get_restaurant_details",
+    "tabelog_get_suggestions",
     "tabelog_list_cuisines",
     "tabelog_search_restaurants",
 ]
@@ -93,6 +100,7 @@ Step 1: Get area suggestions (if user provides area)
 Step 2: Get keyword/cuisine suggestions (if searching by cuisine/keyword)
 → Use: tabelog_get_keyword_suggestions(query="user's keyword")
 → Identify if it's Genre2 (cuisine) or Restaurant (name)
+→ Need both for the same text? tabelog_get_suggestions(query=...) runs them in one call
 
 Step 3: Search with validated parameters
 → Use: tabelog_search_restaurants(area=validated_area, cuisine=validated_cuisine)
@@ -240,7 +248,7 @@ async def tabelog_search_restaurants(
             page=page,
             max_pages=1,
         )
-        response = await request.search()
+        response = await request.search(client=get_async_client())
     except ValueError as e:
         detail = str(e)
         error_code = "unsupported_cuisine" if cuisine and "Unknown cuisine type" in detail else "invalid_parameters"
@@ -450,6 +458,14 @@ async def tabelog_get_restaurant_details(
     )
 
 
+@cache
+def _supported_cuisines() -> tuple[CuisineOutput, ...]:
+    # Cuisine data is static, so build the tool items once and reuse them.
+    return tuple(
+        CuisineOutput(name=cuisine, code=code) for cuisine in get_all_genres() if (code := get_genre_code(cuisine))
+    )
+
+
 @mcp.tool(
     annotations=ToolAnnotations(
         readOnlyHint=True,
@@ -494,7 +510,7 @@ async def tabelog_list_cuisines() -> CuisineListOutput:
         RuntimeError: If cuisine list retrieval fails (should be rare as data is static)
     """
     try:
-        cuisines = get_all_genres()
+        cuisines = _supported_cuisines()
     except ValueError as e:
         return _build_cuisine_list_error_output(
             _build_tool_error(
@@ -516,9 +532,7 @@ async def tabelog_list_cuisines() -> CuisineListOutput:
             )
         )
 
-    return _build_cuisine_list_output(
-        [CuisineOutput(name=cuisine, code=code) for cuisine in cuisines if (code := get_genre_code(cuisine))]
-    )
+    return _build_cuisine_list_output(list(cuisines))
 
 
 @mcp.tool(
@@ -541,8 +555,10 @@ async def tabelog_get_area_suggestions(
     ],
 ) -> SuggestionListOutput:
     """Get area and station suggestions for validating user-provided locations."""
-    normalized_query = query.strip()
+    return await _lookup_area_suggestions(query.strip())
+
 
+async def _lookup_area_suggestions(normalized_query: str) -> SuggestionListOutput:
     try:
         if not normalized_query:
             raise ValueError("query parameter cannot be empty")
@@ -606,8 +622,10 @@ async def tabelog_get_keyword_suggestions(
     ],
 ) -> SuggestionListOutput:
     """Get keyword suggestions for cuisine names, restaurant names, and popular search variants."""
-    normalized_query = query.strip()
+    return await _lookup_keyword_suggestions(query.strip())
 
+
+async def _lookup_keyword_suggestions(normalized_query: str) -> SuggestionListOutput:
     try:
         if not normalized_query:
             raise ValueError("query parameter cannot be empty")
@@ -650,6 +668,35 @@ async def tabelog_get_keyword_suggestions(
     return _build_suggestion_list_output(normalized_query, _to_suggestion_outputs(suggestions))
 
 
+@mcp.tool(
+    annotations=ToolAnnotations(
+        readOnlyHint=True,
+        idempotentHint=True,
+        openWorldHint=True,
+    ),
+    structured_output=True,
+)
+async def tabelog_get_suggestions(
+    query: Annotated[
+        str,
+        Field(
+            description=(
+                "Query in Japanese, hiragana, or romaji. Use this when both the area and the cuisine or "
+                "restaurant name need validating for the same text."
+            ),
+            min_length=1,
+        ),
+    ],
+) -> CombinedSuggestionOutput:
+    """Get area and keyword suggestions for one query with both lookups running concurrently."""
+    normalized_query = query.strip()
+    area, keyword = await asyncio.gather(
+        _lookup_area_suggestions(normalized_query),
+        _lookup_keyword_suggestions(normalized_query),
+    )
+    return _build_combined_suggestion_output(normalized_query, area, keyword)
+
+
 # ============================================================================
 # Server Entry Points
 # ============================================================================
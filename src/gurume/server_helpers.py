@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from datetime import date
 from datetime import time
+from itertools import islice
 from typing import Literal
-from typing import cast
 
 from pydantic import HttpUrl
 from pydantic import TypeAdapter
@@ -15,6 +15,7 @@ from .genre_mapping import get_genre_code
 from .restaurant import Restaurant
 from .restaurant import SortType
 from .search import SearchMeta
+from .server_models import CombinedSuggestionOutput
 from .server_models import CourseOutput
 from .server_models import CuisineListOutput
 from .server_models import CuisineOutput
@@ -26,7 +27,6 @@ from .server_models import ReviewOutput
 from .server_models import SearchFiltersOutput
 from .server_models import SearchMetaOutput
 from .server_models import SortOption
-from .server_models import SuggestionDatatype
 from .server_models import SuggestionListOutput
 from .server_models import SuggestionOutput
 from .server_models import ToolErrorOutput
@@ -41,6 +41,7 @@ SORT_MAP = {
 }
 
 HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+SUGGESTION_LIST_ADAPTER = TypeAdapter(list[SuggestionOutput])
 
 
 def _build_tool_error(
@@ -184,7 +185,7 @@ def _to_restaurant_outputs(response: list[Restaurant], limit: int) -> list[Resta
             lunch_price=restaurant.lunch_price,
             dinner_price=restaurant.dinner_price,
         )
-        for restaurant in response[:limit]
+        for restaurant in islice(response, limit)
     ]
 
 
@@ -207,16 +208,8 @@ def _to_search_meta_output(meta: SearchMeta | None) -> SearchMetaOutput | None:
 
 
 def _to_suggestion_outputs(suggestions: list[AreaSuggestion] | list[KeywordSuggestion]) -> list[SuggestionOutput]:
-    return [
-        SuggestionOutput(
-            name=suggestion.name,
-            datatype=cast(SuggestionDatatype, suggestion.datatype),
-            id_in_datatype=suggestion.id_in_datatype,
-            lat=suggestion.lat,
-            lng=suggestion.lng,
-        )
-        for suggestion in suggestions
-    ]
+    # Validate the whole list in one core pass, reading fields straight off the dataclasses.
+    return SUGGESTION_LIST_ADAPTER.validate_python(suggestions, from_attributes=True)
 
 
 def _build_search_warnings(
@@ -460,3 +453,13 @@ def _build_suggestion_list_output(query: str, items: list[SuggestionOutput]) ->
 
 def _build_suggestion_list_error_output(query: str, error: ToolErrorOutput) -> SuggestionListOutput:
     return SuggestionListOutput(status="error", query=query, error=error)
+
+
+def _build_combined_suggestion_output(
+    query: str,
+    area: SuggestionListOutput,
+    keyword: SuggestionListOutput,
+) -> CombinedSuggestionOutput:
+    if area.status == "error" and keyword.status == "error":
+        return CombinedSuggestionOutput(status="error", query=query, area=area, keyword=keyword, error=area.error)
+    return CombinedSuggestionOutput(status="success", query=query, area=area, keyword=keyword)
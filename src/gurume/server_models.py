@@ -147,6 +147,20 @@ class SuggestionListOutput(BaseModel):
     error: ToolErrorOutput | None = Field(default=None, description="Structured error details when status is error")
 
 
+class CombinedSuggestionOutput(BaseModel):
+    """Structured area and keyword suggestion output for one query."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    status: Literal["success", "error"] = Field(
+        description="`success` when at least one of the area or keyword lookups succeeded"
+    )
+    query: str = Field(description="Normalized query used for both suggestion lookups")
+    area: SuggestionListOutput = Field(description="Area and station suggestions")
+    keyword: SuggestionListOutput = Field(description="Cuisine, restaurant name, and keyword suggestions")
+    error: ToolErrorOutput | None = Field(default=None, description="Structured error details when both lookups failed")
+
+
 class ReviewOutput(BaseModel):
     """Structured restaurant review output."""
 
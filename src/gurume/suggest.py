@@ -2,18 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from typing import Any
+from typing import Protocol
 
 import httpx
 
+from .cache import cache_set
+from .cache import cached_get
+from .http_client import get_async_client
+
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/91.0.4472.124 Safari/537.36"
 )
 SUGGEST_URL = "https://tabelog.com/internal_api/suggest_form_words"
-SUGGEST_PARSE_EXCEPTIONS = (AttributeError, TypeError, ValueError)
+SUGGEST_CACHE_TTL = 60.0  # the same lookup is often repeated within a session
+SUGGEST_TIMEOUT = 10.0
+# Typeahead results are worthless once the user has typed on, so SuggestionSession
+# fails fast: a stalled connect or response yields an empty list instead of waiting.
+TYPEAHEAD_TIMEOUT = httpx.Timeout(3.0, connect=1.0)
+SUGGEST_DEBOUNCE_SECONDS = 0.03  # quiet period before a typeahead query is sent
+
+# Built once and shared by every suggestion request.
+_SUGGEST_URL = httpx.URL(SUGGEST_URL)
+# Compression is negotiated by httpx itself: it advertises gzip/deflate, plus br
+# and zstd whenever brotli or zstandard is installed, so no Accept-Encoding here.
+_HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/json"}
 
 
 class TabelogSuggestUnavailableError(RuntimeError):
@@ -26,7 +44,7 @@ class TabelogSuggestUnavailableError(RuntimeError):
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AreaSuggestion:
     """Area suggestion."""
 
@@ -37,7 +55,7 @@ class AreaSuggestion:
     lng: float | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KeywordSuggestion:
     """Keyword suggestion."""
 
@@ -48,44 +66,105 @@ class KeywordSuggestion:
     lng: float | None = None
 
 
-def _build_headers() -> dict[str, str]:
-    return {"User-Agent": USER_AGENT}
+@dataclass(slots=True)
+class _Flight:
+    """A suggestion request shared by every caller currently waiting on it"""
+
+    task: asyncio.Task[list[Any] | None]
+    waiters: int = 0
+
+
+_IN_FLIGHT: dict[tuple[Any, ...], _Flight] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    # Reuse the pooled client instead of paying a TCP/TLS handshake per lookup.
+    return get_async_client()
+
+
+async def _fetch_payload(params: dict[str, str], request_timeout: float | httpx.Timeout) -> list[Any] | None:
+    try:
+        resp = await _get_client().get(
+            url=_SUGGEST_URL,
+            params=params,
+            headers=_HEADERS,
+            timeout=request_timeout,
+        )
+    except httpx.HTTPError:
+        return None
+    return _decode_payload(resp)
+
+
+def _decode_payload(resp: httpx.Response) -> list[Any] | None:
+    # Shared by the sync and async paths; None means "no usable suggestions".
+    try:
+        resp.raise_for_status()
+        data = resp.json()
+    except (httpx.HTTPError, ValueError):
+        return None
+    if isinstance(data, dict) and data.get("suggest_empty"):
+        raise TabelogSuggestUnavailableError(TabelogSuggestUnavailableError.HELP)
+    if not isinstance(data, list):
+        return None
+    return data
+
+
+async def _fetch_payload_shared(params: dict[str, str], request_timeout: float | httpx.Timeout) -> list[Any] | None:
+    # Single-flight: concurrent callers asking for the same params await the one
+    # request already in flight on this loop instead of each sending their own.
+    # The first caller's timeout applies to everyone sharing its request.
+    key = (asyncio.get_running_loop(), *sorted(params.items()))
+    flight = _IN_FLIGHT.get(key)
+    if flight is None:
+        flight = _IN_FLIGHT[key] = _Flight(asyncio.create_task(_fetch_payload(params, request_timeout)))
+        flight.task.add_done_callback(lambda t: _forget_in_flight(key, flight))
+    flight.waiters += 1
+    try:
+        # Shield so one caller giving up does not cancel the request for the others.
+        return await asyncio.shield(flight.task)
+    finally:
+        flight.waiters -= 1
+        if flight.waiters == 0 and not flight.task.done():
+            # The last waiter was cancelled (e.g. a superseded typeahead query), so
+            # abort the request rather than download a response nobody will read.
+            _forget_in_flight(key, flight)
+            flight.task.cancel()
+
+
+def _forget_in_flight(key: tuple[Any, ...], flight: _Flight) -> None:
+    if _IN_FLIGHT.get(key) is flight:
+        del _IN_FLIGHT[key]
+    if flight.task.done() and not flight.task.cancelled():
+        flight.task.exception()  # mark retrieved even if every caller was cancelled
 
 
 def _parse_area_suggestions(data: list[dict[str, Any]]) -> list[AreaSuggestion]:
-    suggestions: list[AreaSuggestion] = []
-    for item in data:
-        try:
-            suggestions.append(
-                AreaSuggestion(
-                    name=item.get("name", ""),
-                    datatype=item.get("datatype", ""),
-                    id_in_datatype=item.get("id_in_datatype", 0),
-                    lat=item.get("lat"),
-                    lng=item.get("lng"),
-                )
-            )
-        except SUGGEST_PARSE_EXCEPTIONS:
-            continue
-    return suggestions
+    # Non-object entries are skipped; missing fields fall back to empty defaults.
+    return [
+        AreaSuggestion(
+            name=item.get("name", ""),
+            datatype=item.get("datatype", ""),
+            id_in_datatype=item.get("id_in_datatype", 0),
+            lat=item.get("lat"),
+            lng=item.get("lng"),
+        )
+        for item in data
+        if isinstance(item, dict)
+    ]
 
 
 def _parse_keyword_suggestions(data: list[dict[str, Any]]) -> list[KeywordSuggestion]:
-    suggestions: list[KeywordSuggestion] = []
-    for item in data:
-        try:
-            suggestions.append(
-                KeywordSuggestion(
-                    name=item.get("name", ""),
-                    datatype=item.get("datatype", ""),
-                    id_in_datatype=item.get("id_in_datatype", 0),
-                    lat=item.get("lat"),
-                    lng=item.get("lng"),
-                )
-            )
-        except SUGGEST_PARSE_EXCEPTIONS:
-            continue
-    return suggestions
+    return [
+        KeywordSuggestion(
+            name=item.get("name", ""),
+            datatype=item.get("datatype", ""),
+            id_in_datatype=item.get("id_in_datatype", 0),
+            lat=item.get("lat"),
+            lng=item.get("lng"),
+        )
+        for item in data
+        if isinstance(item, dict)
+    ]
 
 
 def get_area_suggestions(query: str, timeout: float = 10.0) -> list[AreaSuggestion]:
@@ -98,63 +177,53 @@ def get_area_suggestions(query: str, timeout: float = 10.0) -> list[AreaSuggesti
     Returns:
         List of area suggestions.
     """
-    if not query or not query.strip():
+    query = query.strip()
+    if not query:
         return []
 
-    params = {"sa": query.strip()}
-
     try:
         resp = httpx.get(
-            url=SUGGEST_URL,
-            params=params,
-            headers=_build_headers(),
+            url=_SUGGEST_URL,
+            params={"sa": query},
+            headers=_HEADERS,
             timeout=timeout,
             follow_redirects=True,
         )
-        resp.raise_for_status()
-        data = resp.json()
-        if isinstance(data, dict) and data.get("suggest_empty"):
-            raise TabelogSuggestUnavailableError(TabelogSuggestUnavailableError.HELP)
-        if not isinstance(data, list):
-            return []
-    except TabelogSuggestUnavailableError:
-        raise
-    except (httpx.HTTPError, ValueError):
+    except httpx.HTTPError:
         return []
-    else:
-        return _parse_area_suggestions(data)
+    data = _decode_payload(resp)
+    return _parse_area_suggestions(data) if data is not None else []
 
 
-async def get_area_suggestions_async(query: str, request_timeout: float = 10.0) -> list[AreaSuggestion]:
+async def get_area_suggestions_async(
+    query: str, request_timeout: float | httpx.Timeout = SUGGEST_TIMEOUT, use_cache: bool = True
+) -> list[AreaSuggestion]:
     """Get area suggestions asynchronously.
 
     Args:
         query: Search keyword.
-        request_timeout: Request timeout in seconds.
+        request_timeout: Request timeout in seconds or as an httpx.Timeout.
+            Defaults to SUGGEST_TIMEOUT.
+        use_cache: Whether to read and store suggestion payloads in the
+            response cache. Defaults to True.
 
     Returns:
         List of area suggestions.
     """
-    if not query or not query.strip():
+    query = query.strip()
+    if not query:
         return []
 
-    params = {"sa": query.strip()}
+    params = {"sa": query}
+    if use_cache and (cached := cached_get(SUGGEST_URL, params)) is not None:
+        return _parse_area_suggestions(cached)
 
-    try:
-        async with httpx.AsyncClient(timeout=request_timeout, follow_redirects=True) as client:
-            resp = await client.get(url=SUGGEST_URL, params=params, headers=_build_headers())
-            resp.raise_for_status()
-            data = resp.json()
-            if isinstance(data, dict) and data.get("suggest_empty"):
-                raise TabelogSuggestUnavailableError(TabelogSuggestUnavailableError.HELP)
-            if not isinstance(data, list):
-                return []
-    except TabelogSuggestUnavailableError:
-        raise
-    except (httpx.HTTPError, ValueError):
+    data = await _fetch_payload_shared(params, request_timeout)
+    if data is None:
         return []
-    else:
-        return _parse_area_suggestions(data)
+    if use_cache:
+        cache_set(SUGGEST_URL, params, data, ttl=SUGGEST_CACHE_TTL)
+    return _parse_area_suggestions(data)
 
 
 def get_keyword_suggestions(query: str, timeout: float = 10.0) -> list[KeywordSuggestion]:
@@ -167,60 +236,120 @@ def get_keyword_suggestions(query: str, timeout: float = 10.0) -> list[KeywordSu
     Returns:
         List of keyword suggestions.
     """
-    if not query or not query.strip():
+    query = query.strip()
+    if not query:
         return []
 
-    params = {"sk": query.strip()}
-
     try:
         resp = httpx.get(
-            url=SUGGEST_URL,
-            params=params,
-            headers=_build_headers(),
+            url=_SUGGEST_URL,
+            params={"sk": query},
+            headers=_HEADERS,
             timeout=timeout,
             follow_redirects=True,
         )
-        resp.raise_for_status()
-        data = resp.json()
-        if isinstance(data, dict) and data.get("suggest_empty"):
-            raise TabelogSuggestUnavailableError(TabelogSuggestUnavailableError.HELP)
-        if not isinstance(data, list):
-            return []
-    except TabelogSuggestUnavailableError:
-        raise
-    except (httpx.HTTPError, ValueError):
+    except httpx.HTTPError:
         return []
-    else:
-        return _parse_keyword_suggestions(data)
+    data = _decode_payload(resp)
+    return _parse_keyword_suggestions(data) if data is not None else []
 
 
-async def get_keyword_suggestions_async(query: str, request_timeout: float = 10.0) -> list[KeywordSuggestion]:
+async def get_keyword_suggestions_async(
+    query: str, request_timeout: float | httpx.Timeout = SUGGEST_TIMEOUT, use_cache: bool = True
+) -> list[KeywordSuggestion]:
     """Get keyword suggestions asynchronously.
 
     Args:
         query: Search keyword.
-        request_timeout: Request timeout in seconds.
+        request_timeout: Request timeout in seconds or as an httpx.Timeout.
+            Defaults to SUGGEST_TIMEOUT.
+        use_cache: Whether to read and store suggestion payloads in the
+            response cache. Defaults to True.
 
     Returns:
         List of keyword suggestions.
     """
-    if not query or not query.strip():
+    query = query.strip()
+    if not query:
         return []
 
-    params = {"sk": query.strip()}
+    params = {"sk": query}
+    if use_cache and (cached := cached_get(SUGGEST_URL, params)) is not None:
+        return _parse_keyword_suggestions(cached)
 
-    try:
-        async with httpx.AsyncClient(timeout=request_timeout, follow_redirects=True) as client:
-            resp = await client.get(url=SUGGEST_URL, params=params, headers=_build_headers())
-            resp.raise_for_status()
-            data = resp.json()
-            if isinstance(data, dict) and data.get("suggest_empty"):
-                raise TabelogSuggestUnavailableError(TabelogSuggestUnavailableError.HELP)
-            if not isinstance(data, list):
-                return []
-    except TabelogSuggestUnavailableError:
-        raise
-    except (httpx.HTTPError, ValueError):
+    data = await _fetch_payload_shared(params, request_timeout)
+    if data is None:
         return []
-    else:
-        return _parse_keyword_suggestions(data)
+    if use_cache:
+        cache_set(SUGGEST_URL, params, data, ttl=SUGGEST_CACHE_TTL)
+    return _parse_keyword_suggestions(data)
+
+
+class SuggestionFetch[T](Protocol):
+    """Suggestion lookup that SuggestionSession can drive, such as get_keyword_suggestions_async"""
+
+    def __call__(self, query: str, *, request_timeout: float | httpx.Timeout) -> Awaitable[list[T]]: ...
+
+
+class SuggestionSession[T]:
+    """Typeahead coordinator that keeps only the latest suggestion lookup alive
+
+    Each query waits for a short quiet period before it is sent, and a new
+    query cancels the previous one if it is still waiting or in flight. A burst
+    of keystrokes therefore issues one request for the final prefix instead of
+    spending bandwidth on responses nobody will see.
+
+    Example:
+        session = SuggestionSession(get_keyword_suggestions_async)
+        suggestions = await session.query("すき")
+    """
+
+    def __init__(
+        self,
+        fetch: SuggestionFetch[T],
+        debounce: float = SUGGEST_DEBOUNCE_SECONDS,
+        request_timeout: float | httpx.Timeout = TYPEAHEAD_TIMEOUT,
+    ) -> None:
+        """Initialize the session
+
+        Args:
+            fetch: Suggestion lookup to run for each query, such as
+                get_keyword_suggestions_async.
+            debounce: Seconds to wait for further queries before sending one.
+                Use 0 to send immediately.
+            request_timeout: Timeout passed to each lookup. Defaults to the
+                short TYPEAHEAD_TIMEOUT.
+        """
+        self._fetch = fetch
+        self._debounce = debounce
+        self._request_timeout = request_timeout
+        self._inflight: asyncio.Task[list[T]] | None = None
+
+    async def _debounced_fetch(self, query: str) -> list[T]:
+        if self._debounce > 0:
+            await asyncio.sleep(self._debounce)
+        return await self._fetch(query, request_timeout=self._request_timeout)
+
+    async def query(self, query: str) -> list[T]:
+        """Look up suggestions for a query, superseding any pending lookup
+
+        Args:
+            query: Search keyword.
+
+        Returns:
+            Suggestions for the query, or an empty list if a newer query
+            superseded this one before it finished.
+        """
+        if self._inflight is not None and not self._inflight.done():
+            self._inflight.cancel()
+
+        task = asyncio.create_task(self._debounced_fetch(query))
+        self._inflight = task
+        try:
+            return await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            # Only swallow cancellation caused by a newer query, never the caller's own.
+            if task is self._inflight or (current is not None and current.cancelling()):
+                raise
+            return []
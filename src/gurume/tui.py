@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-import contextlib
+from functools import partial
 
+from rich.table import Table
+from rich.text import Text
 from textual import on
 from textual.app import App
 from textual.app import ComposeResult
@@ -12,6 +14,7 @@ from textual.containers import Horizontal
 from textual.containers import Vertical
 from textual.css.query import NoMatches
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Button
 from textual.widgets import DataTable
 from textual.widgets import Footer
@@ -26,9 +29,14 @@ from textual.worker import WorkerCancelled
 
 from .genre_mapping import get_all_genres
 from .genre_mapping import get_genre_code
+from .genre_mapping import get_genre_name_by_code
+from .http_client import aclose_async_client
+from .http_client import get_async_client
+from .restaurant import NOT_AVAILABLE
 from .restaurant import Restaurant
 from .restaurant import SortType
 from .search import SearchRequest
+from .search import SearchStatus
 from .suggest import AreaSuggestion
 from .suggest import KeywordSuggestion
 from .suggest import TabelogSuggestUnavailableError
@@ -38,6 +46,29 @@ from .suggest import get_keyword_suggestions_async
 TUI_UPDATE_EXCEPTIONS = (NoMatches, WorkerCancelled)
 TUI_ACTION_EXCEPTIONS = (RuntimeError, ValueError)
 
+# Sort radio button id -> (sort type, label shown in the status line).
+SORT_SELECTIONS: dict[str | None, tuple[SortType, str]] = {
+    "sort-ranking": (SortType.RANKING, "評分排名"),
+    "sort-review": (SortType.REVIEW_COUNT, "評論數排序"),
+    "sort-new": (SortType.NEW_OPEN, "新開幕"),
+    "sort-standard": (SortType.STANDARD, "標準排序"),
+}
+_DEFAULT_SORT_SELECTION = SORT_SELECTIONS["sort-ranking"]
+
+# Sort radio buttons in display order: (button id, short button label).
+SORT_RADIO_BUTTONS: tuple[tuple[str, str], ...] = (
+    ("sort-ranking", "評分排名"),
+    ("sort-review", "評論數"),
+    ("sort-new", "新開幕"),
+    ("sort-standard", "標準"),
+)
+
+# Results table row: name, rating, review count, area, genres.
+ResultRow = tuple[str, str, str, str, str]
+
+# Delay before a submitted search starts, so bursts of Enter presses fetch only once.
+SEARCH_DEBOUNCE_SECONDS = 0.15
+
 
 class AreaSuggestModal(ModalScreen[str]):
     """Area suggestion modal."""
@@ -274,10 +305,8 @@ class SearchPanel(Container):
         with Horizontal(id="sort-row"):
             yield Static("排序:", classes="sort-label")
             with RadioSet(id="sort-radio"):
-                yield RadioButton("評分排名", value=True, id="sort-ranking")
-                yield RadioButton("評論數", id="sort-review")
-                yield RadioButton("新開幕", id="sort-new")
-                yield RadioButton("標準", id="sort-standard")
+                for button_id, label in SORT_RADIO_BUTTONS:
+                    yield RadioButton(label, value=button_id == "sort-ranking", id=button_id)
             yield Button("搜尋", variant="primary", id="search-button")
 
 
@@ -305,132 +334,7 @@ class DetailPanel(Container):
 class TabelogApp(App):
     """Tabelog restaurant search TUI application."""
 
-    CSS = """
-    Screen {
-        layout: vertical;
-    }
-
-    .panel-title {
-        background: $surface-darken-1;
-        color: $text;
-        padding: 0 1;
-        text-align: center;
-        text-style: bold;
-    }
-
-    SearchPanel {
-        height: auto;
-        border: solid $primary-lighten-1;
-        padding: 0 1 1 1;
-        margin: 1 1 0 1;
-    }
-
-    #input-row {
-        height: auto;
-        margin: 0 0 1 0;
-        padding: 0;
-    }
-
-    #area-input, #keyword-input {
-        width: 1fr;
-        margin-right: 1;
-    }
-
-    #area-input:focus, #keyword-input:focus {
-        border: solid $success;
-    }
-
-    #sort-row {
-        height: auto;
-        margin: 0;
-        padding: 0;
-    }
-
-    #content-row {
-        height: 1fr;
-        margin: 0 1 1 1;
-    }
-
-    ResultsTable {
-        width: 2fr;
-        height: 100%;
-        border: solid $primary-lighten-1;
-        margin-right: 1;
-    }
-
-    ResultsTable:focus {
-        border: solid $accent;
-    }
-
-    ResultsTable > .datatable--header {
-        background: $surface-darken-1;
-        color: $text;
-        text-style: bold;
-    }
-
-    ResultsTable > .datatable--cursor {
-        background: $accent-darken-1;
-        color: $text;
-    }
-
-    DetailPanel {
-        width: 1fr;
-        height: 100%;
-        border: solid $primary-lighten-1;
-        padding: 1;
-    }
-
-    .sort-label {
-        width: auto;
-        padding: 0 1 0 0;
-        color: $text-muted;
-        text-style: bold;
-        content-align: center middle;
-    }
-
-    RadioSet {
-        width: 1fr;
-        padding: 0;
-        background: transparent;
-        layout: horizontal;
-    }
-
-    RadioButton {
-        padding: 0 1;
-        margin: 0;
-        background: transparent;
-        color: $text-muted;
-    }
-
-    RadioButton:hover {
-        color: $text;
-    }
-
-    RadioButton.-selected {
-        color: $success;
-        text-style: bold;
-    }
-
-    Button {
-        margin: 0 0 0 1;
-        width: auto;
-        min-width: 20;
-    }
-
-    Button:hover {
-        background: $primary-darken-1;
-    }
-
-    Button:focus {
-        border: solid $accent;
-    }
-
-    #detail-content {
-        height: 100%;
-        overflow-y: auto;
-        padding: 1;
-    }
-    """
+    CSS_PATH = "tui.tcss"
 
     BINDINGS = [
         ("q", "quit", "Quit"),
@@ -439,6 +343,7 @@ class TabelogApp(App):
         ("d", "focus_detail", "Detail"),
         ("f2", "show_area_suggest", "Area Suggest"),
         ("f3", "show_genre_suggest", "Genre Suggest"),
+        ("f5", "refresh_search", "Refresh"),
     ]
 
     def __init__(self, **kwargs):
@@ -446,7 +351,14 @@ class TabelogApp(App):
         self.restaurants: list[Restaurant] = []
         self.selected_restaurant: Restaurant | None = None
         self.search_worker = None
+        self._search_timer: Timer | None = None
         self.current_genre_code: str | None = None  # Currently selected cuisine genre code.
+        # URL of the restaurant currently rendered in the detail panel, if any.
+        self._last_detail_url: str | None = None
+        # Last status message shown in the detail panel, to skip identical re-renders.
+        self._last_status: str | None = None
+        # Table row whose restaurant is shown in the detail panel; -1 when none.
+        self._last_cursor_row = -1
 
     def compose(self) -> ComposeResult:
         """Compose application widgets."""
@@ -457,6 +369,19 @@ class TabelogApp(App):
             yield DetailPanel()
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Cache widget references used on every search and selection."""
+        self._area_input = self.query_one("#area-input", Input)
+        self._keyword_input = self.query_one("#keyword-input", Input)
+        self._sort_radio = self.query_one("#sort-radio", RadioSet)
+        self._results_table = self.query_one("#results-table", ResultsTable)
+        self._detail_panel = self.query_one(DetailPanel)
+        self._detail_content = self.query_one("#detail-content", Static)
+
+    async def on_unmount(self) -> None:
+        """Close pooled HTTP connections when the app exits."""
+        await aclose_async_client()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
         if event.button.id == "search-button":
@@ -467,32 +392,57 @@ class TabelogApp(App):
         if event.input.id in ("area-input", "keyword-input"):
             self.start_search()
 
-    def start_search(self) -> None:
+    def start_search(self, use_cache: bool = True) -> None:
+        """Schedule a search, coalescing rapid repeated submissions into one.
+
+        Args:
+            use_cache: Whether cached result pages may answer the search.
+        """
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(SEARCH_DEBOUNCE_SECONDS, partial(self._launch_search, use_cache))
+
+    def _launch_search(self, use_cache: bool = True) -> None:
         """Start a search and cancel any previous search."""
+        self._search_timer = None
+
         # Cancel the previous search worker.
         if self.search_worker and not self.search_worker.is_finished:
             self.search_worker.cancel()
 
         # Start a new search worker.
-        self.search_worker = self.run_worker(self.perform_search())
+        self.search_worker = self.run_worker(self.perform_search(use_cache))
+
+    async def perform_search(self, use_cache: bool = True) -> None:
+        """Run a restaurant search.
 
-    async def perform_search(self) -> None:
-        """Run a restaurant search."""
+        Args:
+            use_cache: Whether cached result pages may answer the search.
+        """
         try:
             area, keyword = self._get_search_inputs()
             if not area and not keyword:
-                self.query_one("#detail-content", Static).update("請輸入地區或關鍵字")
+                self._set_status("請輸入地區或關鍵字")
                 return
 
             genre_code_to_use, keyword = self._resolve_genre_search(keyword)
             sort_type, sort_name = self._get_sort_selection()
-            detail_content = self.query_one("#detail-content", Static)
             search_params = self._build_search_params_text(area, keyword, genre_code_to_use)
-            detail_content.update(f"搜尋中 ({sort_name}): {search_params}...")
+            self._set_status(f"搜尋中 ({sort_name}): {search_params}...")
 
-            request = SearchRequest(area=area, keyword=keyword, genre_code=genre_code_to_use, sort_type=sort_type)
-            response = await request.search()
-            self._handle_search_response(response.restaurants, search_params, sort_name)
+            request = SearchRequest(
+                area=area,
+                keyword=keyword,
+                genre_code=genre_code_to_use,
+                sort_type=sort_type,
+            )
+            response = await request.search(client=get_async_client(), use_cache=use_cache)
+            if response.status == SearchStatus.ERROR:
+                self._set_status(f"搜尋錯誤: {response.error_message or ''}")
+                return
+            self.restaurants = response.restaurants
+            self.update_results_table()
+            self._finish_search(search_params, sort_name)
         except TUI_ACTION_EXCEPTIONS as e:
             self._update_search_error(e)
         except TUI_UPDATE_EXCEPTIONS as e:
@@ -500,24 +450,30 @@ class TabelogApp(App):
 
     def update_results_table(self) -> None:
         """Update the results table."""
-        try:
-            table = self.query_one("#results-table", ResultsTable)
-            table.clear()
-
-            for restaurant in self.restaurants:
-                rating = f"{restaurant.rating:.2f}" if restaurant.rating else "N/A"
-                review_count = str(restaurant.review_count) if restaurant.review_count else "N/A"
-                area = restaurant.area or "N/A"
-                genres = ", ".join(restaurant.genres[:2]) if restaurant.genres else "N/A"
+        table = self._results_table
+        # A search can finish after the app starts shutting down.
+        if not table.is_mounted:
+            return
 
-                table.add_row(restaurant.name, rating, review_count, area, genres)
-        except TUI_UPDATE_EXCEPTIONS:
-            pass
+        self._last_cursor_row = -1
+        rows = [self._format_result_row(restaurant) for restaurant in self.restaurants]
+        # Clear and refill under one batch so the table lays out and repaints once.
+        with self.batch_update():
+            table.clear()
+            table.add_rows(rows)
+
+    @staticmethod
+    def _format_result_row(restaurant: Restaurant) -> ResultRow:
+        return (
+            restaurant.name,
+            restaurant.rating_text,
+            restaurant.review_count_text,
+            restaurant.area_text,
+            restaurant.short_genres,
+        )
 
     def _get_search_inputs(self) -> tuple[str, str]:
-        area_input = self.query_one("#area-input", Input)
-        keyword_input = self.query_one("#keyword-input", Input)
-        return area_input.value.strip(), keyword_input.value.strip()
+        return self._area_input.value.strip(), self._keyword_input.value.strip()
 
     def _resolve_genre_search(self, keyword: str) -> tuple[str | None, str]:
         detected_genre = get_genre_code(keyword) if keyword else None
@@ -526,21 +482,13 @@ class TabelogApp(App):
         return self.current_genre_code, keyword
 
     def _get_sort_selection(self) -> tuple[SortType, str]:
-        sort_radio = self.query_one("#sort-radio", RadioSet)
-        pressed_button = sort_radio.pressed_button
-        if pressed_button and pressed_button.id == "sort-review":
-            return SortType.REVIEW_COUNT, "評論數排序"
-        if pressed_button and pressed_button.id == "sort-new":
-            return SortType.NEW_OPEN, "新開幕"
-        if pressed_button and pressed_button.id == "sort-standard":
-            return SortType.STANDARD, "標準排序"
-        return SortType.RANKING, "評分排名"
+        pressed_button = self._sort_radio.pressed_button
+        button_id = pressed_button.id if pressed_button else None
+        return SORT_SELECTIONS.get(button_id, _DEFAULT_SORT_SELECTION)
 
     def _build_search_params_text(self, area: str, keyword: str, genre_code: str | None) -> str:
         genre_name = ""
         if genre_code:
-            from .genre_mapping import get_genre_name_by_code
-
             genre_name = get_genre_name_by_code(genre_code) or ""
 
         search_params = f"地區: {area or '(無)'}, 關鍵字: {keyword or '(無)'}"
@@ -548,28 +496,34 @@ class TabelogApp(App):
             search_params += f", 料理類別: {genre_name}"
         return search_params
 
-    def _handle_search_response(self, restaurants: list[Restaurant], search_params: str, sort_name: str) -> None:
-        detail_content = self.query_one("#detail-content", Static)
-        if restaurants:
-            self.restaurants = restaurants
-            self.update_results_table()
-            detail_content.update(f"找到 {len(self.restaurants)} 家餐廳\n搜尋條件: {search_params}\n排序: {sort_name}")
-            return
-
-        self.restaurants = []
-        self.query_one("#results-table", ResultsTable).clear()
-        detail_content.update("沒有找到餐廳")
+    def _finish_search(self, search_params: str, sort_name: str) -> None:
+        if self.restaurants:
+            self._set_status(f"找到 {len(self.restaurants)} 家餐廳\n搜尋條件: {search_params}\n排序: {sort_name}")
+        else:
+            self._set_status("沒有找到餐廳")
 
     def _update_search_error(self, error: BaseException) -> None:
         message = "搜尋已取消" if isinstance(error, WorkerCancelled) else f"搜尋錯誤: {error!s}"
-        with contextlib.suppress(*TUI_UPDATE_EXCEPTIONS):
-            self.query_one("#detail-content", Static).update(message)
+        if self._detail_content.is_mounted:
+            self._set_status(message)
+
+    def _set_status(self, text: str) -> None:
+        """Show a status or prompt message in the detail panel."""
+        if text == self._last_status:
+            return
+        self._detail_content.update(text)
+        self._last_status = text
+        self._last_detail_url = None
+        self._last_cursor_row = -1
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle table row selection events."""
+        if event.cursor_row == self._last_cursor_row:
+            return
         if event.cursor_row < len(self.restaurants):
             self.selected_restaurant = self.restaurants[event.cursor_row]
             self.update_detail_panel()
+            self._last_cursor_row = event.cursor_row
 
     def update_detail_panel(self) -> None:
         """Update the detail panel."""
@@ -577,62 +531,70 @@ class TabelogApp(App):
             return
 
         r = self.selected_restaurant
+        if r.url == self._last_detail_url:
+            return
 
-        detail_text = f"""名稱: {r.name}
-評分: {r.rating or "N/A"}
-評論數: {r.review_count or "N/A"}
-儲存數: {r.save_count or "N/A"}
-地區: {r.area or "N/A"}
-車站: {r.station or "N/A"}
-距離: {r.distance or "N/A"}
-類型: {", ".join(r.genres) if r.genres else "N/A"}
-午餐價格: {r.lunch_price or "N/A"}
-晚餐價格: {r.dinner_price or "N/A"}
-URL: {r.url}
-"""
-
-        detail_content = self.query_one("#detail-content", Static)
-        detail_content.update(detail_text)
+        # Values go in as Text so names containing "[" are never parsed as Rich markup.
+        details = Table.grid(padding=(0, 1))
+        details.add_column(style="bold", no_wrap=True)
+        details.add_column()
+        for label, value in (
+            ("名稱", r.name),
+            ("評分", r.rating_text),
+            ("評論數", r.review_count_text),
+            ("儲存數", r.save_count or NOT_AVAILABLE),
+            ("地區", r.area_text),
+            ("車站", r.station or NOT_AVAILABLE),
+            ("距離", r.distance or NOT_AVAILABLE),
+            ("類型", ", ".join(r.genres) if r.genres else NOT_AVAILABLE),
+            ("午餐價格", r.lunch_price or NOT_AVAILABLE),
+            ("晚餐價格", r.dinner_price or NOT_AVAILABLE),
+            ("URL", r.url),
+        ):
+            details.add_row(f"{label}:", Text(str(value)))
+
+        self._detail_content.update(details)
+        self._last_detail_url = r.url
+        self._last_status = None
+
+    def action_refresh_search(self) -> None:
+        """Re-run the current search, bypassing cached result pages."""
+        self.start_search(use_cache=False)
 
     def action_focus_search(self) -> None:
         """Focus the search input."""
-        area_input = self.query_one("#area-input", Input)
-        area_input.focus()
+        self._area_input.focus()
 
     def action_focus_results(self) -> None:
         """Focus the results table."""
-        table = self.query_one("#results-table", ResultsTable)
-        table.focus()
+        self._results_table.focus()
 
     def action_focus_detail(self) -> None:
         """Focus the detail panel."""
-        detail_panel = self.query_one(DetailPanel)
-        detail_panel.focus()
+        self._detail_panel.focus()
 
     async def action_show_area_suggest(self) -> None:
         """Show the area suggestion modal."""
-        area_input = self.query_one("#area-input", Input)
+        area_input = self._area_input
         query = area_input.value.strip()
 
         if not query:
             # Prompt the user when the input is empty.
-            detail_content = self.query_one("#detail-content", Static)
-            detail_content.update("💡 請先輸入地區關鍵字\n\n例如：東京、大阪、伊勢\n\n然後按 F2 查看建議")
+            self._set_status("💡 請先輸入地區關鍵字\n\n例如：東京、大阪、伊勢\n\n然後按 F2 查看建議")
             return
 
         # Show a loading message.
-        detail_content = self.query_one("#detail-content", Static)
-        detail_content.update(f"🔍 正在搜尋「{query}」的地區建議...\n\n請稍候...")
+        self._set_status(f"🔍 正在搜尋「{query}」的地區建議...\n\n請稍候...")
 
         # Fetch suggestions.
         try:
             suggestions = await get_area_suggestions_async(query)
         except TabelogSuggestUnavailableError as e:
-            detail_content.update(f"⚠️ 地區建議服務暫時無法使用\n\n{e}")
+            self._set_status(f"⚠️ 地區建議服務暫時無法使用\n\n{e}")
             return
 
         if not suggestions:
-            detail_content.update(
+            self._set_status(
                 f"❌ 找不到「{query}」的地區建議\n\n建議：\n• 嘗試更短的關鍵字\n• 使用日文地名\n• 試試附近的地標或車站"
             )
             return
@@ -641,9 +603,9 @@ URL: {r.url}
         def on_dismiss(selected_area: str | None) -> None:
             if selected_area:
                 area_input.value = selected_area
-                detail_content.update(f"✅ 已選擇地區：{selected_area}\n\n現在可以點擊搜尋按鈕或按 Enter 開始搜尋")
+                self._set_status(f"✅ 已選擇地區：{selected_area}\n\n現在可以點擊搜尋按鈕或按 Enter 開始搜尋")
             else:
-                detail_content.update("⏸️ 已取消選擇")
+                self._set_status("⏸️ 已取消選擇")
 
         await self.push_screen(AreaSuggestModal(suggestions), on_dismiss)
 
@@ -653,38 +615,37 @@ URL: {r.url}
         - Empty keyword: show the fixed cuisine list.
         - Non-empty keyword: show dynamic keyword suggestions from the API.
         """
-        keyword_input = self.query_one("#keyword-input", Input)
+        keyword_input = self._keyword_input
         keyword_value = keyword_input.value.strip()
-        detail_content = self.query_one("#detail-content", Static)
 
         # Case 1: empty keyword; show the fixed cuisine list.
         if not keyword_value:
-            detail_content.update("🍽️ 正在載入料理類別選項...")
+            self._set_status("🍽️ 正在載入料理類別選項...")
 
             def on_dismiss_genre(selected_genre: str | None) -> None:
                 if selected_genre:
                     keyword_input.value = selected_genre
                     self.current_genre_code = get_genre_code(selected_genre)
-                    detail_content.update(
+                    self._set_status(
                         f"✅ 已選擇料理類別：{selected_genre}\n\n"
                         f"料理代碼：{self.current_genre_code}\n\n"
                         f"💡 現在可以輸入地區後按搜尋，或直接按 Enter 開始搜尋"
                     )
                 else:
-                    detail_content.update("⏸️ 已取消選擇")
+                    self._set_status("⏸️ 已取消選擇")
 
             await self.push_screen(GenreSuggestModal(), on_dismiss_genre)
 
         # Case 2: non-empty keyword; show dynamic API suggestions.
         else:
-            detail_content.update(f"🔍 正在搜尋「{keyword_value}」的關鍵字建議...")
+            self._set_status(f"🔍 正在搜尋「{keyword_value}」的關鍵字建議...")
 
             try:
                 # Fetch keyword suggestions from the API.
                 suggestions = await get_keyword_suggestions_async(keyword_value)
 
                 if not suggestions:
-                    detail_content.update(
+                    self._set_status(
                         f"❌ 沒有找到「{keyword_value}」的相關建議\n\n"
                         f"💡 提示：\n"
                         f"• 清空關鍵字後按 F3 可查看所有料理類別\n"
@@ -692,7 +653,7 @@ URL: {r.url}
                     )
                     return
 
-                detail_content.update(f"✅ 找到 {len(suggestions)} 個建議")
+                self._set_status(f"✅ 找到 {len(suggestions)} 個建議")
 
                 def on_dismiss_keyword(selected_keyword: str | None) -> None:
                     if selected_keyword:
@@ -700,22 +661,22 @@ URL: {r.url}
                         # Try to resolve a genre_code.
                         self.current_genre_code = get_genre_code(selected_keyword)
                         if self.current_genre_code:
-                            detail_content.update(
+                            self._set_status(
                                 f"✅ 已選擇：{selected_keyword}\n\n"
                                 f"料理代碼：{self.current_genre_code}\n\n"
                                 f"💡 現在可以輸入地區後按搜尋，或直接按 Enter 開始搜尋"
                             )
                         else:
-                            detail_content.update(
+                            self._set_status(
                                 f"✅ 已選擇：{selected_keyword}\n\n💡 現在可以輸入地區後按搜尋，或直接按 Enter 開始搜尋"
                             )
                     else:
-                        detail_content.update("⏸️ 已取消選擇")
+                        self._set_status("⏸️ 已取消選擇")
 
                 await self.push_screen(KeywordSuggestModal(suggestions), on_dismiss_keyword)
 
             except TUI_ACTION_EXCEPTIONS as e:
-                detail_content.update(
+                self._set_status(
                     f"❌ 取得關鍵字建議時發生錯誤\n\n錯誤訊息：{e}\n\n💡 建議：清空關鍵字後按 F3 查看所有料理類別"
                 )
 
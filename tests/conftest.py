@@ -4,6 +4,17 @@ from unittest.mock import Mock
 
 import pytest
 
+from gurume.cache import MemoryCache
+from gurume.cache import set_cache
+from gurume.search import clear_search_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_response_cache():
+    """Give every test empty response and search-page caches so cached pages never leak between tests"""
+    set_cache(MemoryCache())
+    clear_search_cache()
+
 
 @pytest.fixture
 def mock_html_response():
@@ -1,10 +1,16 @@
 """Tests for area mapping (area name to URL slug conversion)"""
 
+import pytest
+
 from gurume.area_mapping import CITY_AREA_PATH_MAPPING
 from gurume.area_mapping import CITY_MAPPING
 from gurume.area_mapping import PREFECTURE_MAPPING
 from gurume.area_mapping import get_area_slug
 
+# Prefecture names with their single 都/府/県 suffix removed (北海道 has none).
+# Only the last character is dropped so "京都府" becomes "京都", not "京".
+_PREFIX_CASES = [(name[:-1], slug) for name, slug in PREFECTURE_MAPPING.items() if name[-1] in "都府県"]
+
 # ============================================================================
 # Test get_area_slug with full prefecture names (都/府/県 suffix)
 # ============================================================================
@@ -35,11 +41,10 @@ def test_get_area_slug_mie_full():
     assert get_area_slug("三重県") == "mie"
 
 
-def test_get_area_slug_all_47_prefectures():
+@pytest.mark.parametrize(("prefecture", "expected_slug"), list(PREFECTURE_MAPPING.items()))
+def test_get_area_slug_all_47_prefectures(prefecture, expected_slug):
     """Test all 47 prefectures with full names"""
-    for prefecture, expected_slug in PREFECTURE_MAPPING.items():
-        result = get_area_slug(prefecture)
-        assert result == expected_slug, f"Failed for {prefecture}: expected {expected_slug}, got {result}"
+    assert get_area_slug(prefecture) == expected_slug
 
 
 # ============================================================================
@@ -82,11 +87,10 @@ def test_get_area_slug_kobe_city():
     assert get_area_slug("神戸") == "hyogo/A2801"
 
 
-def test_get_area_slug_all_major_cities():
+@pytest.mark.parametrize(("city", "expected_slug"), list(CITY_MAPPING.items()))
+def test_get_area_slug_all_major_cities(city, expected_slug):
     """Test all major cities in CITY_MAPPING"""
-    for city, expected_slug in CITY_MAPPING.items():
-        result = get_area_slug(city)
-        assert result == expected_slug, f"Failed for {city}: expected {expected_slug}, got {result}"
+    assert get_area_slug(city) == expected_slug
 
 
 # ============================================================================
@@ -109,19 +113,10 @@ def test_get_area_slug_kanagawa_prefix():
     assert get_area_slug("神奈川") == "kanagawa"
 
 
-def test_get_area_slug_all_prefecture_prefixes():
+@pytest.mark.parametrize(("prefix", "expected_slug"), _PREFIX_CASES)
+def test_get_area_slug_all_prefecture_prefixes(prefix, expected_slug):
     """Test all prefectures without 都/府/県 suffix"""
-    # Test each prefecture by removing the suffix
-    for full_name, expected_slug in PREFECTURE_MAPPING.items():
-        # Remove suffix
-        for suffix in ["都", "府", "県"]:
-            if full_name.endswith(suffix):
-                prefix = full_name[: -len(suffix)]
-                result = get_area_slug(prefix)
-                assert result == expected_slug, (
-                    f"Failed for {prefix} (from {full_name}): expected {expected_slug}, got {result}"
-                )
-                break
+    assert get_area_slug(prefix) == expected_slug
 
 
 # ============================================================================
@@ -163,9 +158,9 @@ def test_get_area_slug_invalid_input():
 # ============================================================================
 
 
-def test_get_area_slug_hokkaido_tohoku_region():
-    """Test all Hokkaido/Tohoku prefectures"""
-    hokkaido_tohoku = [
+@pytest.mark.parametrize(
+    ("prefecture", "expected"),
+    [
         ("北海道", "hokkaido"),
         ("青森県", "aomori"),
         ("岩手県", "iwate"),
@@ -173,15 +168,16 @@ def test_get_area_slug_hokkaido_tohoku_region():
         ("秋田県", "akita"),
         ("山形県", "yamagata"),
         ("福島県", "fukushima"),
-    ]
-
-    for prefecture, expected in hokkaido_tohoku:
-        assert get_area_slug(prefecture) == expected
+    ],
+)
+def test_get_area_slug_hokkaido_tohoku_region(prefecture, expected):
+    """Test all Hokkaido/Tohoku prefectures"""
+    assert get_area_slug(prefecture) == expected
 
 
-def test_get_area_slug_kanto_region():
-    """Test all Kanto prefectures"""
-    kanto = [
+@pytest.mark.parametrize(
+    ("prefecture", "expected"),
+    [
         ("茨城県", "ibaraki"),
         ("栃木県", "tochigi"),
         ("群馬県", "gunma"),
@@ -189,15 +185,16 @@ def test_get_area_slug_kanto_region():
         ("千葉県", "chiba"),
         ("東京都", "tokyo"),
         ("神奈川県", "kanagawa"),
-    ]
-
-    for prefecture, expected in kanto:
-        assert get_area_slug(prefecture) == expected
+    ],
+)
+def test_get_area_slug_kanto_region(prefecture, expected):
+    """Test all Kanto prefectures"""
+    assert get_area_slug(prefecture) == expected
 
 
-def test_get_area_slug_chubu_region():
-    """Test all Chubu prefectures"""
-    chubu = [
+@pytest.mark.parametrize(
+    ("prefecture", "expected"),
+    [
         ("新潟県", "niigata"),
         ("富山県", "toyama"),
         ("石川県", "ishikawa"),
@@ -207,15 +204,16 @@ def test_get_area_slug_chubu_region():
         ("岐阜県", "gifu"),
         ("静岡県", "shizuoka"),
         ("愛知県", "aichi"),
-    ]
-
-    for prefecture, expected in chubu:
-        assert get_area_slug(prefecture) == expected
+    ],
+)
+def test_get_area_slug_chubu_region(prefecture, expected):
+    """Test all Chubu prefectures"""
+    assert get_area_slug(prefecture) == expected
 
 
-def test_get_area_slug_kinki_region():
-    """Test all Kinki/Kansai prefectures"""
-    kinki = [
+@pytest.mark.parametrize(
+    ("prefecture", "expected"),
+    [
         ("三重県", "mie"),
         ("滋賀県", "shiga"),
         ("京都府", "kyoto"),
@@ -223,42 +221,45 @@ def test_get_area_slug_kinki_region():
         ("兵庫県", "hyogo"),
         ("奈良県", "nara"),
         ("和歌山県", "wakayama"),
-    ]
-
-    for prefecture, expected in kinki:
-        assert get_area_slug(prefecture) == expected
+    ],
+)
+def test_get_area_slug_kinki_region(prefecture, expected):
+    """Test all Kinki/Kansai prefectures"""
+    assert get_area_slug(prefecture) == expected
 
 
-def test_get_area_slug_chugoku_region():
-    """Test all Chugoku prefectures"""
-    chugoku = [
+@pytest.mark.parametrize(
+    ("prefecture", "expected"),
+    [
         ("鳥取県", "tottori"),
         ("島根県", "shimane"),
         ("岡山県", "okayama"),
         ("広島県", "hiroshima"),
         ("山口県", "yamaguchi"),
-    ]
-
-    for prefecture, expected in chugoku:
-        assert get_area_slug(prefecture) == expected
+    ],
+)
+def test_get_area_slug_chugoku_region(prefecture, expected):
+    """Test all Chugoku prefectures"""
+    assert get_area_slug(prefecture) == expected
 
 
-def test_get_area_slug_shikoku_region():
-    """Test all Shikoku prefectures"""
-    shikoku = [
+@pytest.mark.parametrize(
+    ("prefecture", "expected"),
+    [
         ("徳島県", "tokushima"),
         ("香川県", "kagawa"),
         ("愛媛県", "ehime"),
         ("高知県", "kochi"),
-    ]
-
-    for prefecture, expected in shikoku:
-        assert get_area_slug(prefecture) == expected
+    ],
+)
+def test_get_area_slug_shikoku_region(prefecture, expected):
+    """Test all Shikoku prefectures"""
+    assert get_area_slug(prefecture) == expected
 
 
-def test_get_area_slug_kyushu_okinawa_region():
-    """Test all Kyushu/Okinawa prefectures"""
-    kyushu_okinawa = [
+@pytest.mark.parametrize(
+    ("prefecture", "expected"),
+    [
         ("福岡県", "fukuoka"),
         ("佐賀県", "saga"),
         ("長崎県", "nagasaki"),
@@ -267,10 +268,11 @@ def test_get_area_slug_kyushu_okinawa_region():
         ("宮崎県", "miyazaki"),
         ("鹿児島県", "kagoshima"),
         ("沖縄県", "okinawa"),
-    ]
-
-    for prefecture, expected in kyushu_okinawa:
-        assert get_area_slug(prefecture) == expected
+    ],
+)
+def test_get_area_slug_kyushu_okinawa_region(prefecture, expected):
+    """Test all Kyushu/Okinawa prefectures"""
+    assert get_area_slug(prefecture) == expected
 
 
 # ============================================================================
@@ -389,6 +391,20 @@ def test_get_area_slug_multiple_suffixes():
 # ============================================================================
 
 
+def test_get_area_slug_memoizes_repeated_names():
+    """Test that repeated lookups are answered from the memo cache"""
+    get_area_slug.cache_clear()
+
+    assert get_area_slug("福岡市") == "fukuoka"
+    assert get_area_slug("福岡市") == "fukuoka"
+    assert get_area_slug("不存在の町") is None
+    assert get_area_slug("不存在の町") is None
+
+    info = get_area_slug.cache_info()
+    assert info.hits == 2
+    assert info.misses == 2
+
+
 def test_lookup_strategy_priority():
     """Test that lookup follows correct priority order"""
     # Priority: PREFECTURE_MAPPING > CITY_MAPPING > _PREFIX_TO_SLUG
@@ -414,6 +430,13 @@ def test_suffix_removal_order():
     assert get_area_slug("福岡市") == "fukuoka"  # 市
 
 
+def test_suffix_removal_strips_only_one_character():
+    """Test that only the last suffix is removed, so names ending in 都 keep it"""
+    # "京都市" -> "京都"; stripping every suffix character would leave "京"
+    assert get_area_slug("京都市") == "kyoto"
+    assert get_area_slug("京都府") == "kyoto"
+
+
 def test_hokkaido_special_case():
     """Test Hokkaido which doesn't have 都/府/県 suffix"""
     # Hokkaido is unique - it's already without suffix
@@ -403,6 +403,44 @@ class TestSearchCommand:
         ]
         assert "搜尋中" in result.stderr
 
+    def test_jsonl_output_writes_one_object_per_line(self):
+        from typer.testing import CliRunner
+
+        from gurume.cli import app
+
+        response = SearchResponse(
+            status=SearchStatus.SUCCESS,
+            restaurants=[
+                Restaurant(name="すし店", url="https://tabelog.com/tokyo/A1301/A130101/1/"),
+                Restaurant(name="ラーメン店", url="https://tabelog.com/tokyo/A1301/A130101/2/"),
+            ],
+        )
+        runner = CliRunner()
+        with patch("gurume.search.SearchRequest.search_sync", return_value=response):
+            result = runner.invoke(app, ["search", "--area", "東京", "--output", "jsonl"])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["すし店", "ラーメン店"]
+        assert "搜尋中" in result.stderr
+
+    def test_json_output_keeps_long_and_bracketed_names_intact(self):
+        from typer.testing import CliRunner
+
+        from gurume.cli import app
+
+        name = "[bold]すし店 " + "とても長い名前" * 10
+        response = SearchResponse(
+            status=SearchStatus.SUCCESS,
+            restaurants=[Restaurant(name=name, url="https://tabelog.com/tokyo/A1301/A130101/1/")],
+        )
+        runner = CliRunner()
+        with patch("gurume.search.SearchRequest.search_sync", return_value=response):
+            result = runner.invoke(app, ["search", "--area", "東京", "--output", "json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)[0]["name"] == name
+
     def test_limit_must_be_positive(self):
         import re
 
@@ -433,6 +471,24 @@ class TestSearchCommand:
         assert result.exit_code == 0
         assert "無法精準映射地區" in result.output
 
+    def test_no_cache_flag_bypasses_response_cache(self):
+        from typer.testing import CliRunner
+
+        from gurume.cli import app
+
+        response = SearchResponse(
+            status=SearchStatus.SUCCESS,
+            restaurants=[Restaurant(name="すし店", url="https://tabelog.com/tokyo/A1301/A130101/1/")],
+        )
+        runner = CliRunner()
+        with patch("gurume.cli.SearchRequest") as mock_request_class:
+            mock_request = mock_request_class.return_value
+            mock_request.search_sync.return_value = response
+            result = runner.invoke(app, ["search", "--area", "東京", "--no-cache"])
+
+        assert result.exit_code == 0
+        mock_request.search_sync.assert_called_once_with(use_cache=False)
+
     def test_keyword_matching_cuisine_uses_cuisine_filter_without_keyword(self):
         from typer.testing import CliRunner
 
@@ -1,5 +1,7 @@
 """Tests for genre mapping (cuisine type to genre code conversion)"""
 
+import pytest
+
 from gurume.genre_mapping import CUISINE_SLUG_MAPPING
 from gurume.genre_mapping import GENRE_CODE_MAPPING
 from gurume.genre_mapping import get_all_genres
@@ -237,16 +239,15 @@ def test_get_all_genres_all_in_mapping():
 # ============================================================================
 
 
-def test_roundtrip_all_genres():
+@pytest.mark.parametrize("original_name", get_all_genres())
+def test_roundtrip_all_genres(original_name):
     """Test that all genres can be converted to code and back"""
-    for original_name in get_all_genres():
-        # Name -> Code
-        code = get_genre_code(original_name)
-        assert code is not None, f"No code for {original_name}"
+    # Name -> Code
+    code = get_genre_code(original_name)
+    assert code is not None, f"No code for {original_name}"
 
-        # Code -> Name
-        reversed_name = get_genre_name_by_code(code)
-        assert reversed_name == original_name, f"Roundtrip failed for {original_name}"
+    # Code -> Name
+    assert get_genre_name_by_code(code) == original_name
 
 
 def test_all_codes_unique():
@@ -0,0 +1,83 @@
+"""Tests for shared HTTP client module"""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from gurume.http_client import aclose_async_client
+from gurume.http_client import get_async_client
+
+
+@pytest.mark.asyncio
+async def test_get_async_client_reuses_client_within_loop():
+    """Repeated calls on the same loop share one pooled client"""
+    client = get_async_client()
+    try:
+        assert get_async_client() is client
+        assert not client.is_closed
+    finally:
+        await aclose_async_client()
+
+
+@pytest.mark.asyncio
+async def test_get_async_client_recreates_closed_client():
+    """A closed client is replaced instead of being handed out"""
+    client = get_async_client()
+    await client.aclose()
+
+    replacement = get_async_client()
+    try:
+        assert replacement is not client
+        assert not replacement.is_closed
+    finally:
+        await aclose_async_client()
+
+
+@pytest.mark.asyncio
+async def test_aclose_async_client_closes_shared_client():
+    """Closing drops the shared client so the next call opens a fresh one"""
+    client = get_async_client()
+    await aclose_async_client()
+
+    assert client.is_closed
+    await aclose_async_client()  # closing twice is a no-op
+
+
+@pytest.mark.asyncio
+async def test_get_async_client_negotiates_http2(monkeypatch):
+    """The pooled client is built with HTTP/2 so concurrent requests share one connection"""
+    created: list[dict[str, Any]] = []
+    async_client = httpx.AsyncClient
+
+    def record_client(**kwargs: Any) -> httpx.AsyncClient:
+        created.append(kwargs)
+        return async_client(**kwargs)
+
+    await aclose_async_client()  # the session loop may already hold a client
+    monkeypatch.setattr("httpx.AsyncClient", record_client)
+    get_async_client()
+    try:
+        assert created[0]["http2"] is True
+    finally:
+        await aclose_async_client()
+
+
+def test_get_async_client_requires_running_loop():
+    """The client is bound to an event loop and cannot be created outside one"""
+    with pytest.raises(RuntimeError):
+        get_async_client()
+
+
+def test_get_async_client_is_per_loop():
+    """Each event loop gets its own client"""
+
+    async def _get_and_close():
+        client = get_async_client()
+        await aclose_async_client()
+        return client
+
+    first = asyncio.run(_get_and_close())
+    second = asyncio.run(_get_and_close())
+    assert first is not second
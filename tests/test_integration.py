@@ -135,9 +135,11 @@ class TestIntegration:
         assert params["ChkOnlineBooking"] == "1"
         assert params["ChkRoom"] == "1"
 
-    @patch("httpx.get")
-    def test_multi_page_search_integration(self, mock_get):
+    @patch("httpx.Client")
+    def test_multi_page_search_integration(self, mock_client_class):
         """Test multi-page search integration"""
+        mock_get = mock_client_class.return_value.__enter__.return_value.get
+
         # Mock responses for multiple pages
         page1_html = """
         <html>
@@ -264,12 +266,14 @@ class TestIntegration:
         assert restaurant.dinner_price == "ディナー ¥15,000～¥19,999"
 
         # Verify async client was used correctly
-        mock_client_class.assert_called_once_with(timeout=30.0, follow_redirects=True)
+        mock_client_class.assert_called_once_with(timeout=30.0, follow_redirects=True, http2=True)
         mock_client.get.assert_called_once()
 
-    @patch("httpx.get")
-    def test_error_handling_integration(self, mock_get):
+    @patch("httpx.Client")
+    def test_error_handling_integration(self, mock_client_class):
         """Test error handling integration"""
+        mock_get = mock_client_class.return_value.__enter__.return_value.get
+
         # Test HTTP error
         mock_get.side_effect = Exception("Network error")
 
@@ -281,9 +285,11 @@ class TestIntegration:
         assert len(response.restaurants) == 0
         assert response.meta is None
 
-    @patch("httpx.get")
-    def test_no_results_integration(self, mock_get):
+    @patch("httpx.Client")
+    def test_no_results_integration(self, mock_client_class):
         """Test no results integration"""
+        mock_get = mock_client_class.return_value.__enter__.return_value.get
+
         mock_html = """
         <html>
         <body>
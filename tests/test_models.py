@@ -42,6 +42,35 @@ class TestRestaurant:
         assert restaurant.genres == []
         assert restaurant.image_urls == []
 
+    def test_restaurant_display_text(self):
+        """Test display helpers format known values and fall back to N/A"""
+        restaurant = Restaurant(
+            name="テストレストラン",
+            url="https://tabelog.com/tokyo/A1301/A130101/13000001/",
+            rating=3.5,
+            review_count=120,
+            area="銀座",
+            genres=["寿司", "海鮮", "日本料理"],
+        )
+        minimal = Restaurant(name="テスト", url="https://tabelog.com/tokyo/A1301/A130101/13000002/")
+
+        assert restaurant.rating_text == "3.50"
+        assert restaurant.review_count_text == "120"
+        assert restaurant.area_text == "銀座"
+        assert restaurant.short_genres == "寿司, 海鮮"
+        assert minimal.rating_text == "N/A"
+        assert minimal.review_count_text == "N/A"
+        assert minimal.area_text == "N/A"
+        assert minimal.short_genres == "N/A"
+
+    def test_restaurant_uses_slots(self):
+        """Test restaurants carry no per-instance __dict__"""
+        restaurant = Restaurant(name="テスト", url="https://tabelog.com/tokyo/A1301/A130101/13000001/")
+
+        assert not hasattr(restaurant, "__dict__")
+        with pytest.raises(AttributeError):
+            restaurant.unknown_field = "value"  # type: ignore[attr-defined]
+
 
 class TestRestaurantSearchRequest:
     """Test RestaurantSearchRequest model"""
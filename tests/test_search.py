@@ -14,6 +14,13 @@ from gurume.search import SearchResponse
 from gurume.search import SearchStatus
 
 
+@pytest.fixture
+def mock_get():
+    """Patch httpx.Client and return the get method of the client used by search_sync"""
+    with patch("httpx.Client") as mock_client_class:
+        yield mock_client_class.return_value.__enter__.return_value.get
+
+
 class TestSearchMeta:
     """Test SearchMeta model"""
 
@@ -89,6 +96,28 @@ class TestSearchResponse:
         assert len(response.restaurants) == 0
         assert response.error_message == "HTTP 404 Not Found"
 
+    def test_filter_applies_all_criteria_in_one_pass(self):
+        """Test combined filters and that the predicate only sees rows passing earlier criteria"""
+        restaurants = [
+            Restaurant(name="A", url="https://a", rating=3.8, review_count=200),
+            Restaurant(name="B", url="https://b", rating=3.2, review_count=500),
+            Restaurant(name="C", url="https://c", rating=4.1, review_count=10),
+            Restaurant(name="D", url="https://d", rating=4.0, review_count=None),
+            Restaurant(name="E", url="https://e", rating=3.9, review_count=300),
+        ]
+        response = SearchResponse(status=SearchStatus.SUCCESS, restaurants=restaurants)
+        seen: list[str] = []
+
+        def condition(restaurant: Restaurant) -> bool:
+            seen.append(restaurant.name)
+            return restaurant.name != "E"
+
+        filtered = response.filter(condition=condition, min_rating=3.5, min_review_count=100)
+
+        assert [r.name for r in filtered.restaurants] == ["A"]
+        assert seen == ["A", "E"]
+        assert response.filter().restaurants is not restaurants
+
 
 class TestSearchRequest:
     """Test SearchRequest functionality"""
@@ -234,7 +263,6 @@ class TestSearchRequest:
         assert restaurant_request.party_size == 2
         assert restaurant_request.page == 2
 
-    @patch("httpx.get")
     def test_do_sync_respects_start_page(self, mock_get, mock_html_response):
         """Test synchronous search starts from the requested page"""
         mock_response = Mock()
@@ -260,7 +288,6 @@ class TestSearchRequest:
         called_params = mock_get.call_args.kwargs["params"]
         assert called_params["PG"] == "2"
 
-    @patch("httpx.get")
     def test_do_sync_single_page(self, mock_get, mock_html_response):
         """Test synchronous search for single page"""
         mock_response = Mock()
@@ -283,10 +310,9 @@ class TestSearchRequest:
         assert response.meta.total_count == 100
         assert response.error_message is None
 
-        # Check that httpx.get was called once
+        # Check that the client fetched once
         mock_get.assert_called_once()
 
-    @patch("httpx.get")
     def test_do_sync_multiple_pages(self, mock_get, mock_html_response):
         """Test synchronous search for multiple pages"""
         mock_response = Mock()
@@ -307,10 +333,9 @@ class TestSearchRequest:
         assert len(response.restaurants) == 6  # 2 restaurants per page * 3 pages
         assert response.meta is not None
 
-        # Check that httpx.get was called 3 times
+        # Check that the client fetched 3 times
         assert mock_get.call_count == 3
 
-    @patch("httpx.get")
     def test_do_sync_no_results(self, mock_get):
         """Test synchronous search with no results"""
         mock_response = Mock()
@@ -332,7 +357,6 @@ class TestSearchRequest:
         assert response.meta is not None
         assert response.meta.total_count == 0
 
-    @patch("httpx.get")
     def test_do_sync_http_error(self, mock_get):
         """Test synchronous search with HTTP error"""
         mock_get.side_effect = httpx.HTTPStatusError("404 Not Found", request=Mock(), response=Mock())
@@ -344,7 +368,55 @@ class TestSearchRequest:
         assert response.error_message is not None and "404 Not Found" in response.error_message
         assert len(response.restaurants) == 0
 
-    @patch("httpx.get")
+    def test_search_sync_serves_repeat_pages_from_cache(self, mock_get, mock_html_response):
+        """Test that a repeated search is answered from the response cache"""
+        mock_response = Mock()
+        mock_response.text = mock_html_response
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        first = SearchRequest(area="銀座", keyword="寿司").search_sync()
+        second = SearchRequest(area="銀座", keyword="寿司").search_sync()
+        SearchRequest(area="銀座", keyword="寿司").search_sync(use_cache=False)
+
+        assert [r.name for r in second.restaurants] == [r.name for r in first.restaurants]
+        assert mock_get.call_count == 2
+
+    def test_search_pages_stay_out_of_global_response_cache(self, mock_get, mock_html_response):
+        """Test that result pages use the small search-page cache, not the global response cache"""
+        from gurume.cache import get_cache
+        from gurume.search import SEARCH_CACHE_MAX_SIZE
+        from gurume.search import SEARCH_CACHE_TTL
+
+        mock_response = Mock()
+        mock_response.text = mock_html_response
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        SearchRequest(area="銀座", keyword="寿司").search_sync()
+        SearchRequest(area="銀座", keyword="寿司").search_sync()
+
+        assert mock_get.call_count == 1
+        assert get_cache().size() == 0
+        assert SEARCH_CACHE_TTL <= 120
+        assert SEARCH_CACHE_MAX_SIZE <= 64
+
+    def test_search_sync_reuses_injected_client(self, mock_get, mock_html_response):
+        """Test that an injected sync client is shared across pages"""
+        mock_response = Mock()
+        mock_response.text = mock_html_response
+        mock_response.raise_for_status = Mock()
+
+        client = Mock()
+        client.get.return_value = mock_response
+
+        request = SearchRequest(area="銀座", keyword="寿司", max_pages=2, include_meta=False)
+        response = request.search_sync(client=client)
+
+        assert response.status == SearchStatus.SUCCESS
+        assert client.get.call_count == 2
+        mock_get.assert_not_called()
+
     def test_do_sync_without_meta(self, mock_get, mock_html_response):
         """Test synchronous search without metadata"""
         mock_response = Mock()
@@ -397,7 +469,7 @@ class TestSearchRequest:
         assert response.meta.total_count == 100
 
         # Check that AsyncClient was created with correct parameters
-        mock_client_class.assert_called_once_with(timeout=30.0, follow_redirects=True)
+        mock_client_class.assert_called_once_with(timeout=30.0, follow_redirects=True, http2=True)
         mock_client.get.assert_called_once()
 
     @pytest.mark.asyncio
@@ -433,6 +505,190 @@ class TestSearchRequest:
         # Check that get was called 2 times
         assert mock_client.get.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_do_async_stops_at_first_empty_page(self, mock_html_response):
+        """Test concurrent page fetches keep page order and stop at an empty page"""
+        from unittest.mock import AsyncMock
+
+        pages = {
+            1: mock_html_response,
+            2: "<html><body></body></html>",
+            3: mock_html_response,
+        }
+
+        async def fake_get(url, params=None, **kwargs):
+            response = Mock()
+            response.text = pages[int((params or {}).get("PG", 1))]
+            response.raise_for_status = Mock()
+            return response
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=fake_get)
+
+        request = SearchRequest(area="銀座", keyword="寿司", max_pages=3, include_meta=False)
+        response = await request.search(client=mock_client)
+
+        assert response.status == SearchStatus.SUCCESS
+        assert len(response.restaurants) == 2
+        assert mock_client.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_do_async_bounds_concurrent_page_fetches(self, mock_html_response):
+        """Test that follow-up page fetches respect max_concurrency"""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(url, params=None, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            response = Mock()
+            response.text = mock_html_response
+            response.raise_for_status = Mock()
+            return response
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=fake_get)
+
+        request = SearchRequest(area="銀座", max_pages=5, include_meta=False, max_concurrency=2)
+        response = await request.search(client=mock_client)
+
+        assert len(response.restaurants) == 10
+        assert mock_client.get.call_count == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_each_page_in_order(self, mock_html_response):
+        """Test streaming hands back one restaurant list per page and stops at an empty page"""
+        from unittest.mock import AsyncMock
+
+        pages = {
+            1: mock_html_response,
+            2: mock_html_response,
+            3: "<html><body></body></html>",
+            4: mock_html_response,
+        }
+
+        async def fake_get(url, params=None, **kwargs):
+            response = Mock()
+            response.text = pages[int((params or {}).get("PG", 1))]
+            response.raise_for_status = Mock()
+            return response
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=fake_get)
+
+        request = SearchRequest(area="銀座", keyword="寿司", max_pages=4, include_meta=False)
+        streamed = [restaurants async for restaurants in request.stream(client=mock_client)]
+
+        assert [len(restaurants) for restaurants in streamed] == [2, 2]
+        assert streamed[0][0].name == "テストレストラン1"
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_stream_closes_owned_client(self, mock_client_class, mock_html_response):
+        """Test streaming without an injected client opens and closes its own"""
+        from unittest.mock import AsyncMock
+
+        mock_response = Mock()
+        mock_response.text = mock_html_response
+        mock_response.raise_for_status = Mock()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client_class.return_value = mock_client
+
+        request = SearchRequest(area="銀座", keyword="寿司", max_pages=1)
+        streamed = [restaurants async for restaurants in request.stream()]
+
+        assert len(streamed) == 1
+        mock_client.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_raises_on_http_error(self):
+        """Test streaming surfaces request failures instead of an error response"""
+        from unittest.mock import AsyncMock
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=httpx.ConnectError("connection refused"))
+
+        request = SearchRequest(area="銀座", keyword="寿司")
+        with pytest.raises(RuntimeError, match="connection refused"):
+            async for _ in request.stream(client=mock_client):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_zero_max_pages_sends_no_request(self, mock_get):
+        """Test that sync and async searches agree that max_pages=0 fetches nothing"""
+        from unittest.mock import AsyncMock
+
+        mock_client = AsyncMock()
+        request = SearchRequest(area="銀座", keyword="寿司", max_pages=0)
+
+        response = await request.search(client=mock_client)
+        streamed = [restaurants async for restaurants in request.stream(client=mock_client)]
+        sync_response = request.search_sync()
+
+        mock_client.get.assert_not_awaited()
+        mock_get.assert_not_called()
+        assert streamed == []
+        assert response.status == sync_response.status == SearchStatus.NO_RESULTS
+
+    @pytest.mark.asyncio
+    async def test_stream_propagates_consumer_cancellation(self):
+        """Test cancelling a stream consumer raises CancelledError rather than RuntimeError"""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        started = asyncio.Event()
+
+        async def hanging_get(*args, **kwargs):
+            started.set()
+            await asyncio.Event().wait()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=hanging_get)
+
+        async def consume():
+            request = SearchRequest(area="銀座", keyword="寿司")
+            async for _ in request.stream(client=mock_client):
+                pass
+
+        task = asyncio.create_task(consume())
+        await started.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_search_reuses_injected_client(self, mock_client_class, mock_html_response):
+        """Test that an injected client is used instead of creating a new one"""
+        from unittest.mock import AsyncMock
+
+        mock_response = Mock()
+        mock_response.text = mock_html_response
+        mock_response.raise_for_status = Mock()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        request = SearchRequest(area="銀座", keyword="寿司", max_pages=1)
+        response = await request.search(client=mock_client)
+
+        assert response.status == SearchStatus.SUCCESS
+        mock_client_class.assert_not_called()
+        mock_client.__aexit__.assert_not_called()
+        assert mock_client.get.call_args.kwargs["timeout"] == 30.0
+
     @pytest.mark.asyncio
     @patch("httpx.AsyncClient")
     async def test_do_async_http_error(self, mock_client_class):
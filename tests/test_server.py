@@ -1,11 +1,13 @@
 """Tests for MCP server tools (FastMCP implementation)"""
 
+import dataclasses
 from typing import Any
 from typing import cast
 from unittest.mock import AsyncMock
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
+import pytest_asyncio
 
 from gurume.detail import Course
 from gurume.detail import MenuItem
@@ -17,6 +19,7 @@ from gurume.restaurant import Restaurant
 from gurume.search import SearchMeta
 from gurume.search import SearchResponse
 from gurume.search import SearchStatus
+from gurume.server import CombinedSuggestionOutput
 from gurume.server import CuisineListOutput
 from gurume.server import CuisineOutput
 from gurume.server import RestaurantDetailOutput
@@ -24,10 +27,12 @@ from gurume.server import RestaurantOutput
 from gurume.server import RestaurantSearchOutput
 from gurume.server import SuggestionListOutput
 from gurume.server import SuggestionOutput
+from gurume.server import _supported_cuisines
 from gurume.server import mcp
 from gurume.server import tabelog_get_area_suggestions
 from gurume.server import tabelog_get_keyword_suggestions
 from gurume.server import tabelog_get_restaurant_details
+from gurume.server import tabelog_get_suggestions
 from gurume.server import tabelog_list_cuisines
 from gurume.server import tabelog_search_restaurants
 from gurume.suggest import AreaSuggestion
@@ -38,7 +43,55 @@ from gurume.suggest import KeywordSuggestion
 # ============================================================================
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def cuisines():
+    """Cuisine list from tabelog_list_cuisines, built once per session
+
+    The list is derived from the static genre mapping, so tests that only read it
+    can share one result instead of each walking the mapping again.
+    """
+    return await tabelog_list_cuisines()
+
+
+@pytest.fixture(scope="session")
+def expected_cuisines():
+    """Genre names from genre_mapping that have a cuisine code"""
+    return [genre for genre in get_all_genres() if get_genre_code(genre)]
+
+
+@pytest.fixture
+def shared_client(monkeypatch):
+    """Stand-in for the pooled client the server hands to every search"""
+    client = MagicMock()
+    monkeypatch.setattr("gurume.server.get_async_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def search_mock(monkeypatch, shared_client):
+    """Replace SearchRequest.search with an AsyncMock for one test"""
+    mock = AsyncMock()
+    monkeypatch.setattr("gurume.server.SearchRequest.search", mock)
+    return mock
+
+
+@pytest.fixture
+def area_suggestions_mock(monkeypatch):
+    """Replace the area suggestion lookup used by the server with an AsyncMock"""
+    mock = AsyncMock()
+    monkeypatch.setattr("gurume.server.get_area_suggestions_async", mock)
+    return mock
+
+
 @pytest.fixture
+def keyword_suggestions_mock(monkeypatch):
+    """Replace the keyword suggestion lookup used by the server with an AsyncMock"""
+    mock = AsyncMock()
+    monkeypatch.setattr("gurume.server.get_keyword_suggestions_async", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
 def sample_restaurants():
     """Sample restaurant data for testing"""
     return [
@@ -65,7 +118,17 @@ def sample_restaurants():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def success_response(sample_restaurants):
+    """Successful search response wrapping sample_restaurants without metadata"""
+    return SearchResponse(
+        status=SearchStatus.SUCCESS,
+        restaurants=sample_restaurants,
+        meta=None,
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_area_suggestions():
     """Sample area suggestion data"""
     return [
@@ -86,7 +149,7 @@ def sample_area_suggestions():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_keyword_suggestions():
     """Sample keyword suggestion data"""
     return [
@@ -117,13 +180,16 @@ def sample_keyword_suggestions():
 @pytest.fixture
 def sample_restaurant_detail(sample_restaurants):
     """Sample restaurant detail for MCP detail tool tests"""
-    restaurant = sample_restaurants[0]
-    restaurant.station = "銀座駅"
-    restaurant.address = "東京都中央区銀座1-2-3"
-    restaurant.phone = "03-1111-2222"
-    restaurant.business_hours = "11:00 - 22:00"
-    restaurant.closed_days = "日曜日"
-    restaurant.reservation_url = "https://tabelog.com/tokyo/A1301/A130101/13000001/reserve/"
+    # Copy rather than mutate: sample_restaurants is shared across the session
+    restaurant = dataclasses.replace(
+        sample_restaurants[0],
+        station="銀座駅",
+        address="東京都中央区銀座1-2-3",
+        phone="03-1111-2222",
+        business_hours="11:00 - 22:00",
+        closed_days="日曜日",
+        reservation_url="https://tabelog.com/tokyo/A1301/A130101/13000001/reserve/",
+    )
     return RestaurantDetail(
         restaurant=restaurant,
         reviews=[
@@ -161,7 +227,7 @@ def sample_restaurant_detail(sample_restaurants):
 
 
 @pytest.mark.asyncio
-async def test_search_restaurants_success(sample_restaurants):
+async def test_search_restaurants_success(sample_restaurants, search_mock, shared_client):
     """Test successful restaurant search"""
     mock_response = SearchResponse(
         status=SearchStatus.SUCCESS,
@@ -176,66 +242,58 @@ async def test_search_restaurants_success(sample_restaurants):
         ),
     )
 
-    with patch("gurume.server.SearchRequest.search", new_callable=AsyncMock) as mock_search:
-        mock_search.return_value = mock_response
+    search_mock.return_value = mock_response
 
-        results = await tabelog_search_restaurants(
-            area="東京",
-            cuisine="寿司",
-            sort="ranking",
-            limit=20,
-        )
+    results = await tabelog_search_restaurants(
+        area="東京",
+        cuisine="寿司",
+        sort="ranking",
+        limit=20,
+    )
 
-        # Verify results
-        assert isinstance(results, RestaurantSearchOutput)
-        assert results.status == "success"
-        assert len(results.items) == 2
-        assert isinstance(results.items[0], RestaurantOutput)
-        assert results.items[0].name == "テスト寿司"
-        assert results.items[0].rating == 4.5
-        assert results.items[0].review_count == 123
-        assert results.items[0].area == "銀座"
-        assert results.items[0].genres == ["寿司", "和食"]
-        assert results.items[0].lunch_price == "¥5,000～¥5,999"
-        assert results.items[0].dinner_price == "¥10,000～¥14,999"
-        assert results.returned_count == 2
-        assert results.limit == 20
-        assert results.applied_filters.area == "東京"
-        assert results.applied_filters.cuisine == "寿司"
-        assert results.applied_filters.genre_code == "RC0201"
-        assert results.applied_filters.page == 1
-        assert results.has_more is False
-        assert results.meta is not None
-        assert results.meta.current_page == 1
-
-        # Verify SearchRequest was called correctly
-        mock_search.assert_called_once()
+    # Verify results
+    assert isinstance(results, RestaurantSearchOutput)
+    assert results.status == "success"
+    assert len(results.items) == 2
+    assert isinstance(results.items[0], RestaurantOutput)
+    assert results.items[0].name == "テスト寿司"
+    assert results.items[0].rating == 4.5
+    assert results.items[0].review_count == 123
+    assert results.items[0].area == "銀座"
+    assert results.items[0].genres == ["寿司", "和食"]
+    assert results.items[0].lunch_price == "¥5,000～¥5,999"
+    assert results.items[0].dinner_price == "¥10,000～¥14,999"
+    assert results.returned_count == 2
+    assert results.limit == 20
+    assert results.applied_filters.area == "東京"
+    assert results.applied_filters.cuisine == "寿司"
+    assert results.applied_filters.genre_code == "RC0201"
+    assert results.applied_filters.page == 1
+    assert results.has_more is False
+    assert results.meta is not None
+    assert results.meta.current_page == 1
+
+    # Verify the search ran once on the shared pooled client
+    search_mock.assert_awaited_once_with(client=shared_client)
 
 
 @pytest.mark.asyncio
-async def test_search_restaurants_with_keyword(sample_restaurants):
+async def test_search_restaurants_with_keyword(success_response, search_mock, shared_client):
     """Test restaurant search with keyword parameter"""
-    mock_response = SearchResponse(
-        status=SearchStatus.SUCCESS,
-        restaurants=sample_restaurants,
-        meta=None,
-    )
-
-    with patch("gurume.server.SearchRequest.search", new_callable=AsyncMock) as mock_search:
-        mock_search.return_value = mock_response
+    search_mock.return_value = success_response
 
-        results = await tabelog_search_restaurants(
-            area="東京",
-            keyword="ラーメン",
-            sort="review-count",
-            limit=10,
-        )
+    results = await tabelog_search_restaurants(
+        area="東京",
+        keyword="ラーメン",
+        sort="review-count",
+        limit=10,
+    )
 
-        assert len(results.items) == 2
-        assert results.applied_filters.keyword == "ラーメン"
-        assert results.applied_filters.sort == "review-count"
-        assert results.applied_filters.page == 1
-        mock_search.assert_called_once()
+    assert len(results.items) == 2
+    assert results.applied_filters.keyword == "ラーメン"
+    assert results.applied_filters.sort == "review-count"
+    assert results.applied_filters.page == 1
+    search_mock.assert_awaited_once_with(client=shared_client)
 
 
 @pytest.mark.asyncio
@@ -252,40 +310,35 @@ async def test_search_restaurants_rejects_keyword_with_cuisine():
 
 
 @pytest.mark.asyncio
-async def test_search_restaurants_with_reservation_filters(sample_restaurants):
+async def test_search_restaurants_with_reservation_filters(success_response, monkeypatch):
     """Test restaurant search forwards reservation filters to SearchRequest"""
-    mock_response = SearchResponse(
-        status=SearchStatus.SUCCESS,
-        restaurants=sample_restaurants,
-        meta=None,
+    mock_request_class = MagicMock()
+    monkeypatch.setattr("gurume.server.SearchRequest", mock_request_class)
+    mock_request = mock_request_class.return_value
+    mock_request.search = AsyncMock(return_value=success_response)
+
+    results = await tabelog_search_restaurants(
+        area="東京",
+        reservation_date="20260427",
+        reservation_time="1900",
+        party_size=2,
     )
 
-    with patch("gurume.server.SearchRequest") as mock_request_class:
-        mock_request = mock_request_class.return_value
-        mock_request.search = AsyncMock(return_value=mock_response)
-
-        results = await tabelog_search_restaurants(
-            area="東京",
-            reservation_date="20260427",
-            reservation_time="1900",
-            party_size=2,
-        )
-
-        assert len(results.items) == 2
-        assert results.applied_filters.reservation_date == "20260427"
-        assert results.applied_filters.reservation_time == "1900"
-        assert results.applied_filters.party_size == 2
-        assert results.applied_filters.page == 1
-        mock_request.search.assert_awaited_once()
-        mock_request_class.assert_called_once()
+    assert len(results.items) == 2
+    assert results.applied_filters.reservation_date == "20260427"
+    assert results.applied_filters.reservation_time == "1900"
+    assert results.applied_filters.party_size == 2
+    assert results.applied_filters.page == 1
+    mock_request.search.assert_awaited_once()
+    mock_request_class.assert_called_once()
 
-        assert mock_request_class.call_args.kwargs["reservation_date"] == "20260427"
-        assert mock_request_class.call_args.kwargs["reservation_time"] == "1900"
-        assert mock_request_class.call_args.kwargs["party_size"] == 2
+    assert mock_request_class.call_args.kwargs["reservation_date"] == "20260427"
+    assert mock_request_class.call_args.kwargs["reservation_time"] == "1900"
+    assert mock_request_class.call_args.kwargs["party_size"] == 2
 
 
 @pytest.mark.asyncio
-async def test_search_restaurants_limit_applied(sample_restaurants):
+async def test_search_restaurants_limit_applied(sample_restaurants, search_mock):
     """Test that limit parameter is correctly applied"""
     # Create 5 sample restaurants
     many_restaurants = sample_restaurants * 3  # 6 restaurants
@@ -296,18 +349,17 @@ async def test_search_restaurants_limit_applied(sample_restaurants):
         meta=None,
     )
 
-    with patch("gurume.server.SearchRequest.search", new_callable=AsyncMock) as mock_search:
-        mock_search.return_value = mock_response
+    search_mock.return_value = mock_response
 
-        # Request only 3 results
-        results = await tabelog_search_restaurants(
-            area="東京",
-            limit=3,
-        )
+    # Request only 3 results
+    results = await tabelog_search_restaurants(
+        area="東京",
+        limit=3,
+    )
 
-        # Should only return 3 results, not all 6
-        assert len(results.items) == 3
-        assert results.returned_count == 3
+    # Should only return 3 results, not all 6
+    assert len(results.items) == 3
+    assert results.returned_count == 3
 
 
 @pytest.mark.asyncio
@@ -422,31 +474,21 @@ async def test_search_restaurants_unknown_cuisine():
 
 
 @pytest.mark.asyncio
-async def test_search_restaurants_all_sort_types(sample_restaurants):
+@pytest.mark.parametrize("sort_type", ["ranking", "review-count", "new-open", "standard"])
+async def test_search_restaurants_all_sort_types(success_response, search_mock, sort_type):
     """Test all valid sort type values"""
-    mock_response = SearchResponse(
-        status=SearchStatus.SUCCESS,
-        restaurants=sample_restaurants,
-        meta=None,
-    )
-
-    sort_types = ["ranking", "review-count", "new-open", "standard"]
-
-    for sort_type in sort_types:
-        with patch("gurume.server.SearchRequest.search", new_callable=AsyncMock) as mock_search:
-            mock_search.return_value = mock_response
+    search_mock.return_value = success_response
 
-            results = await tabelog_search_restaurants(sort=sort_type)
-        assert len(results.items) == 2
+    results = await tabelog_search_restaurants(sort=sort_type)
+    assert len(results.items) == 2
 
 
 @pytest.mark.asyncio
-async def test_search_restaurants_runtime_error():
+async def test_search_restaurants_runtime_error(search_mock):
     """Test error handling when search operation fails"""
-    with patch("gurume.server.SearchRequest.search", new_callable=AsyncMock) as mock_search:
-        mock_search.side_effect = Exception("Network error")
+    search_mock.side_effect = Exception("Network error")
 
-        result = await tabelog_search_restaurants(area="東京")
+    result = await tabelog_search_restaurants(area="東京")
 
     assert result.status == "error"
     assert result.error is not None
@@ -456,7 +498,7 @@ async def test_search_restaurants_runtime_error():
 
 
 @pytest.mark.asyncio
-async def test_search_restaurants_raises_for_error_status():
+async def test_search_restaurants_raises_for_error_status(search_mock):
     """Test MCP wrapper returns structured errors for SearchResponse failures"""
     mock_response = SearchResponse(
         status=SearchStatus.ERROR,
@@ -465,10 +507,9 @@ async def test_search_restaurants_raises_for_error_status():
         error_message="upstream error",
     )
 
-    with patch("gurume.server.SearchRequest.search", new_callable=AsyncMock) as mock_search:
-        mock_search.return_value = mock_response
+    search_mock.return_value = mock_response
 
-        result = await tabelog_search_restaurants(area="東京")
+    result = await tabelog_search_restaurants(area="東京")
 
     assert result.status == "error"
     assert result.error is not None
@@ -477,7 +518,7 @@ async def test_search_restaurants_raises_for_error_status():
 
 
 @pytest.mark.asyncio
-async def test_search_restaurants_no_results_envelope():
+async def test_search_restaurants_no_results_envelope(search_mock):
     """Test empty searches return a no_results envelope"""
     mock_response = SearchResponse(
         status=SearchStatus.NO_RESULTS,
@@ -485,10 +526,9 @@ async def test_search_restaurants_no_results_envelope():
         meta=None,
     )
 
-    with patch("gurume.server.SearchRequest.search", new_callable=AsyncMock) as mock_search:
-        mock_search.return_value = mock_response
+    search_mock.return_value = mock_response
 
-        results = await tabelog_search_restaurants(area="東京")
+    results = await tabelog_search_restaurants(area="東京")
 
     assert results.status == "no_results"
     assert results.items == []
@@ -497,7 +537,7 @@ async def test_search_restaurants_no_results_envelope():
 
 
 @pytest.mark.asyncio
-async def test_search_restaurants_forwards_page_and_has_more(sample_restaurants):
+async def test_search_restaurants_forwards_page_and_has_more(sample_restaurants, monkeypatch):
     """Test explicit MCP page requests propagate to SearchRequest and metadata"""
     mock_response = SearchResponse(
         status=SearchStatus.SUCCESS,
@@ -512,11 +552,12 @@ async def test_search_restaurants_forwards_page_and_has_more(sample_restaurants)
         ),
     )
 
-    with patch("gurume.server.SearchRequest") as mock_request_class:
-        mock_request = mock_request_class.return_value
-        mock_request.search = AsyncMock(return_value=mock_response)
+    mock_request_class = MagicMock()
+    monkeypatch.setattr("gurume.server.SearchRequest", mock_request_class)
+    mock_request = mock_request_class.return_value
+    mock_request.search = AsyncMock(return_value=mock_response)
 
-        results = await tabelog_search_restaurants(area="東京", cuisine="寿司", page=2, limit=2)
+    results = await tabelog_search_restaurants(area="東京", cuisine="寿司", page=2, limit=2)
 
     assert results.applied_filters.page == 2
     assert results.meta is not None
@@ -531,19 +572,20 @@ async def test_search_restaurants_forwards_page_and_has_more(sample_restaurants)
 
 
 @pytest.mark.asyncio
-async def test_get_restaurant_details_success(sample_restaurant_detail):
+async def test_get_restaurant_details_success(sample_restaurant_detail, monkeypatch):
     """Test successful restaurant detail fetch"""
-    with patch("gurume.server.RestaurantDetailRequest") as mock_request_class:
-        mock_request = mock_request_class.return_value
-        mock_request.fetch = AsyncMock(return_value=sample_restaurant_detail)
-
-        result = await tabelog_get_restaurant_details(
-            restaurant_url="https://tabelog.com/tokyo/A1301/A130101/13000001/",
-            fetch_reviews=True,
-            fetch_menu=True,
-            fetch_courses=False,
-            max_review_pages=2,
-        )
+    mock_request_class = MagicMock()
+    monkeypatch.setattr("gurume.server.RestaurantDetailRequest", mock_request_class)
+    mock_request = mock_request_class.return_value
+    mock_request.fetch = AsyncMock(return_value=sample_restaurant_detail)
+
+    result = await tabelog_get_restaurant_details(
+        restaurant_url="https://tabelog.com/tokyo/A1301/A130101/13000001/",
+        fetch_reviews=True,
+        fetch_menu=True,
+        fetch_courses=False,
+        max_review_pages=2,
+    )
 
     assert isinstance(result, RestaurantDetailOutput)
     assert result.status == "success"
@@ -592,15 +634,16 @@ async def test_get_restaurant_details_invalid_url():
 
 
 @pytest.mark.asyncio
-async def test_get_restaurant_details_runtime_error():
+async def test_get_restaurant_details_runtime_error(monkeypatch):
     """Test detail tool wraps runtime errors with actionable context"""
-    with patch("gurume.server.RestaurantDetailRequest") as mock_request_class:
-        mock_request = mock_request_class.return_value
-        mock_request.fetch = AsyncMock(side_effect=RuntimeError("timeout"))
+    mock_request_class = MagicMock()
+    monkeypatch.setattr("gurume.server.RestaurantDetailRequest", mock_request_class)
+    mock_request = mock_request_class.return_value
+    mock_request.fetch = AsyncMock(side_effect=RuntimeError("timeout"))
 
-        result = await tabelog_get_restaurant_details(
-            restaurant_url="https://tabelog.com/tokyo/A1301/A130101/13000001/",
-        )
+    result = await tabelog_get_restaurant_details(
+        restaurant_url="https://tabelog.com/tokyo/A1301/A130101/13000001/",
+    )
 
     assert result.status == "error"
     assert result.error is not None
@@ -614,9 +657,9 @@ async def test_get_restaurant_details_runtime_error():
 
 
 @pytest.mark.asyncio
-async def test_list_cuisines_success():
+async def test_list_cuisines_success(cuisines):
     """Test successful cuisine list retrieval"""
-    results = await tabelog_list_cuisines()
+    results = cuisines
 
     # Verify results
     assert isinstance(results, CuisineListOutput)
@@ -639,36 +682,43 @@ async def test_list_cuisines_success():
 
 
 @pytest.mark.asyncio
-async def test_list_cuisines_matches_genre_mapping():
+async def test_list_cuisines_matches_genre_mapping(cuisines, expected_cuisines):
     """Test that list_cuisines matches genre_mapping data"""
-    results = await tabelog_list_cuisines()
-
-    # Get expected cuisines from genre_mapping
-    all_genres = get_all_genres()
-
-    # Filter out cuisines without codes
-    expected_cuisines = []
-    for genre in all_genres:
-        code = get_genre_code(genre)
-        if code:
-            expected_cuisines.append(genre)
+    results = cuisines
 
     # Verify counts match
     assert len(results.items) == len(expected_cuisines)
 
     # Verify all expected cuisines are present
-    result_names = [c.name for c in results.items]
-    for expected in expected_cuisines:
-        assert expected in result_names
+    result_names = {c.name for c in results.items}
+    missing = set(expected_cuisines) - result_names
+    assert not missing
 
 
 @pytest.mark.asyncio
-async def test_list_cuisines_runtime_error():
+async def test_list_cuisines_builds_items_once(monkeypatch):
+    """Test that the static cuisine list is computed once and reused"""
+    _supported_cuisines.cache_clear()
+    first = await tabelog_list_cuisines()
+
+    mock_get_all = MagicMock()
+    monkeypatch.setattr("gurume.server.get_all_genres", mock_get_all)
+    second = await tabelog_list_cuisines()
+
+    mock_get_all.assert_not_called()
+    assert second.items == first.items
+    assert second.items is not first.items
+
+
+@pytest.mark.asyncio
+async def test_list_cuisines_runtime_error(monkeypatch):
     """Test error handling when cuisine list retrieval fails"""
-    with patch("gurume.server.get_all_genres") as mock_get_all:
-        mock_get_all.side_effect = Exception("Unexpected error")
+    _supported_cuisines.cache_clear()
+    mock_get_all = MagicMock()
+    monkeypatch.setattr("gurume.server.get_all_genres", mock_get_all)
+    mock_get_all.side_effect = Exception("Unexpected error")
 
-        result = await tabelog_list_cuisines()
+    result = await tabelog_list_cuisines()
 
     assert result.status == "error"
     assert result.error is not None
@@ -682,52 +732,44 @@ async def test_list_cuisines_runtime_error():
 
 
 @pytest.mark.asyncio
-async def test_get_area_suggestions_success(sample_area_suggestions):
+async def test_get_area_suggestions_success(sample_area_suggestions, area_suggestions_mock):
     """Test successful area suggestions retrieval"""
-    with patch(
-        "gurume.server.get_area_suggestions_async",
-        new_callable=AsyncMock,
-    ) as mock_get_suggestions:
-        mock_get_suggestions.return_value = sample_area_suggestions
+    area_suggestions_mock.return_value = sample_area_suggestions
 
-        results = await tabelog_get_area_suggestions(query="東京")
+    results = await tabelog_get_area_suggestions(query="東京")
 
-        # Verify results
-        assert isinstance(results, SuggestionListOutput)
-        assert results.status == "success"
-        assert len(results.items) == 2
-        assert isinstance(results.items[0], SuggestionOutput)
-        assert results.items[0].name == "東京都"
-        assert results.items[0].datatype == "AddressMaster"
-        assert results.items[0].id_in_datatype == 13
-        assert results.items[0].lat == 35.6895
-        assert results.items[0].lng == 139.6917
+    # Verify results
+    assert isinstance(results, SuggestionListOutput)
+    assert results.status == "success"
+    assert len(results.items) == 2
+    assert isinstance(results.items[0], SuggestionOutput)
+    assert results.items[0].name == "東京都"
+    assert results.items[0].datatype == "AddressMaster"
+    assert results.items[0].id_in_datatype == 13
+    assert results.items[0].lat == 35.6895
+    assert results.items[0].lng == 139.6917
 
-        assert results.items[1].name == "渋谷駅"
-        assert results.items[1].datatype == "RailroadStation"
+    assert results.items[1].name == "渋谷駅"
+    assert results.items[1].datatype == "RailroadStation"
 
-        # Verify API was called with stripped query
-        mock_get_suggestions.assert_called_once_with("東京")
+    # Verify API was called with stripped query
+    area_suggestions_mock.assert_called_once_with("東京")
 
 
 @pytest.mark.asyncio
-async def test_get_area_suggestions_accepts_town_datatype():
+async def test_get_area_suggestions_accepts_town_datatype(area_suggestions_mock):
     """Test area suggestions can return upstream Town datatypes."""
-    with patch(
-        "gurume.server.get_area_suggestions_async",
-        new_callable=AsyncMock,
-    ) as mock_get_suggestions:
-        mock_get_suggestions.return_value = [
-            AreaSuggestion(
-                name="三重町",
-                datatype="Town",
-                id_in_datatype=12345,
-                lat=33.0,
-                lng=131.5,
-            )
-        ]
+    area_suggestions_mock.return_value = [
+        AreaSuggestion(
+            name="三重町",
+            datatype="Town",
+            id_in_datatype=12345,
+            lat=33.0,
+            lng=131.5,
+        )
+    ]
 
-        results = await tabelog_get_area_suggestions(query="三重")
+    results = await tabelog_get_area_suggestions(query="三重")
 
     assert results.status == "success"
     assert len(results.items) == 1
@@ -736,47 +778,34 @@ async def test_get_area_suggestions_accepts_town_datatype():
 
 
 @pytest.mark.asyncio
-async def test_get_area_suggestions_strips_whitespace(sample_area_suggestions):
+async def test_get_area_suggestions_strips_whitespace(sample_area_suggestions, area_suggestions_mock):
     """Test that query whitespace is stripped"""
-    with patch(
-        "gurume.server.get_area_suggestions_async",
-        new_callable=AsyncMock,
-    ) as mock_get_suggestions:
-        mock_get_suggestions.return_value = sample_area_suggestions
+    area_suggestions_mock.return_value = sample_area_suggestions
 
-        await tabelog_get_area_suggestions(query="  東京  ")
+    await tabelog_get_area_suggestions(query="  東京  ")
 
-        # Should be called with stripped query
-        mock_get_suggestions.assert_called_once_with("東京")
+    # Should be called with stripped query
+    area_suggestions_mock.assert_called_once_with("東京")
 
 
 @pytest.mark.asyncio
-async def test_get_area_suggestions_empty_query():
+@pytest.mark.parametrize("query", ["", "   "])
+async def test_get_area_suggestions_empty_query(query):
     """Test validation of empty query"""
-    empty_result = await tabelog_get_area_suggestions(query="")
-    blank_result = await tabelog_get_area_suggestions(query="   ")
+    result = await tabelog_get_area_suggestions(query=query)
 
-    assert empty_result.status == "error"
-    assert empty_result.error is not None
-    assert empty_result.error.error_code == "invalid_parameters"
-    assert "query parameter cannot be empty" in empty_result.error.detail
-
-    assert blank_result.status == "error"
-    assert blank_result.error is not None
-    assert blank_result.error.error_code == "invalid_parameters"
-    assert "query parameter cannot be empty" in blank_result.error.detail
+    assert result.status == "error"
+    assert result.error is not None
+    assert result.error.error_code == "invalid_parameters"
+    assert "query parameter cannot be empty" in result.error.detail
 
 
 @pytest.mark.asyncio
-async def test_get_area_suggestions_runtime_error():
+async def test_get_area_suggestions_runtime_error(area_suggestions_mock):
     """Test error handling when API request fails"""
-    with patch(
-        "gurume.server.get_area_suggestions_async",
-        new_callable=AsyncMock,
-    ) as mock_get_suggestions:
-        mock_get_suggestions.side_effect = Exception("Network error")
+    area_suggestions_mock.side_effect = Exception("Network error")
 
-        result = await tabelog_get_area_suggestions(query="東京")
+    result = await tabelog_get_area_suggestions(query="東京")
 
     assert result.status == "error"
     assert result.error is not None
@@ -790,83 +819,66 @@ async def test_get_area_suggestions_runtime_error():
 
 
 @pytest.mark.asyncio
-async def test_get_keyword_suggestions_success(sample_keyword_suggestions):
+async def test_get_keyword_suggestions_success(sample_keyword_suggestions, keyword_suggestions_mock):
     """Test successful keyword suggestions retrieval"""
-    with patch(
-        "gurume.server.get_keyword_suggestions_async",
-        new_callable=AsyncMock,
-    ) as mock_get_suggestions:
-        mock_get_suggestions.return_value = sample_keyword_suggestions
+    keyword_suggestions_mock.return_value = sample_keyword_suggestions
 
-        results = await tabelog_get_keyword_suggestions(query="すき")
+    results = await tabelog_get_keyword_suggestions(query="すき")
 
-        # Verify results
-        assert isinstance(results, SuggestionListOutput)
-        assert results.status == "success"
-        assert len(results.items) == 3
-        assert isinstance(results.items[0], SuggestionOutput)
+    # Verify results
+    assert isinstance(results, SuggestionListOutput)
+    assert results.status == "success"
+    assert len(results.items) == 3
+    assert isinstance(results.items[0], SuggestionOutput)
 
-        # Genre2 suggestion
-        assert results.items[0].name == "すき焼き"
-        assert results.items[0].datatype == "Genre2"
-        assert results.items[0].id_in_datatype == 107
-        assert results.items[0].lat is None
-        assert results.items[0].lng is None
+    # Genre2 suggestion
+    assert results.items[0].name == "すき焼き"
+    assert results.items[0].datatype == "Genre2"
+    assert results.items[0].id_in_datatype == 107
+    assert results.items[0].lat is None
+    assert results.items[0].lng is None
 
-        # Restaurant suggestion
-        assert results.items[1].name == "和田金"
-        assert results.items[1].datatype == "Restaurant"
+    # Restaurant suggestion
+    assert results.items[1].name == "和田金"
+    assert results.items[1].datatype == "Restaurant"
 
-        # DetailCondition suggestion
-        assert results.items[2].name == "すき焼き ランチ"
-        assert results.items[2].datatype == "Genre2 DetailCondition"
+    # DetailCondition suggestion
+    assert results.items[2].name == "すき焼き ランチ"
+    assert results.items[2].datatype == "Genre2 DetailCondition"
 
-        # Verify API was called with stripped query
-        mock_get_suggestions.assert_called_once_with("すき")
+    # Verify API was called with stripped query
+    keyword_suggestions_mock.assert_called_once_with("すき")
 
 
 @pytest.mark.asyncio
-async def test_get_keyword_suggestions_strips_whitespace(sample_keyword_suggestions):
+async def test_get_keyword_suggestions_strips_whitespace(sample_keyword_suggestions, keyword_suggestions_mock):
     """Test that query whitespace is stripped"""
-    with patch(
-        "gurume.server.get_keyword_suggestions_async",
-        new_callable=AsyncMock,
-    ) as mock_get_suggestions:
-        mock_get_suggestions.return_value = sample_keyword_suggestions
+    keyword_suggestions_mock.return_value = sample_keyword_suggestions
 
-        await tabelog_get_keyword_suggestions(query="  すき  ")
+    await tabelog_get_keyword_suggestions(query="  すき  ")
 
-        # Should be called with stripped query
-        mock_get_suggestions.assert_called_once_with("すき")
+    # Should be called with stripped query
+    keyword_suggestions_mock.assert_called_once_with("すき")
 
 
 @pytest.mark.asyncio
-async def test_get_keyword_suggestions_empty_query():
+@pytest.mark.parametrize("query", ["", "   "])
+async def test_get_keyword_suggestions_empty_query(query):
     """Test validation of empty query"""
-    empty_result = await tabelog_get_keyword_suggestions(query="")
-    blank_result = await tabelog_get_keyword_suggestions(query="   ")
+    result = await tabelog_get_keyword_suggestions(query=query)
 
-    assert empty_result.status == "error"
-    assert empty_result.error is not None
-    assert empty_result.error.error_code == "invalid_parameters"
-    assert "query parameter cannot be empty" in empty_result.error.detail
-
-    assert blank_result.status == "error"
-    assert blank_result.error is not None
-    assert blank_result.error.error_code == "invalid_parameters"
-    assert "query parameter cannot be empty" in blank_result.error.detail
+    assert result.status == "error"
+    assert result.error is not None
+    assert result.error.error_code == "invalid_parameters"
+    assert "query parameter cannot be empty" in result.error.detail
 
 
 @pytest.mark.asyncio
-async def test_get_keyword_suggestions_runtime_error():
+async def test_get_keyword_suggestions_runtime_error(keyword_suggestions_mock):
     """Test error handling when API request fails"""
-    with patch(
-        "gurume.server.get_keyword_suggestions_async",
-        new_callable=AsyncMock,
-    ) as mock_get_suggestions:
-        mock_get_suggestions.side_effect = Exception("Network error")
+    keyword_suggestions_mock.side_effect = Exception("Network error")
 
-        result = await tabelog_get_keyword_suggestions(query="すき")
+    result = await tabelog_get_keyword_suggestions(query="すき")
 
     assert result.status == "error"
     assert result.error is not None
@@ -874,16 +886,70 @@ async def test_get_keyword_suggestions_runtime_error():
     assert result.error.detail == "Network error"
 
 
+# ============================================================================
+# Test tabelog_get_suggestions
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_get_suggestions_combines_area_and_keyword(
+    sample_area_suggestions, sample_keyword_suggestions, area_suggestions_mock, keyword_suggestions_mock
+):
+    """Test combined suggestions run both lookups for the stripped query"""
+    area_suggestions_mock.return_value = sample_area_suggestions
+    keyword_suggestions_mock.return_value = sample_keyword_suggestions
+
+    result = await tabelog_get_suggestions(query="  東京  ")
+
+    assert isinstance(result, CombinedSuggestionOutput)
+    assert result.status == "success"
+    assert result.query == "東京"
+    assert result.error is None
+    assert [item.name for item in result.area.items] == ["東京都", "渋谷駅"]
+    assert result.keyword.returned_count == 3
+    area_suggestions_mock.assert_awaited_once_with("東京")
+    keyword_suggestions_mock.assert_awaited_once_with("東京")
+
+
+@pytest.mark.asyncio
+async def test_get_suggestions_keeps_partial_results(
+    sample_keyword_suggestions, area_suggestions_mock, keyword_suggestions_mock
+):
+    """Test one failed lookup does not discard the other lookup's suggestions"""
+    area_suggestions_mock.side_effect = RuntimeError("Suggest API down")
+    keyword_suggestions_mock.return_value = sample_keyword_suggestions
+
+    result = await tabelog_get_suggestions(query="すき")
+
+    assert result.status == "success"
+    assert result.area.status == "error"
+    assert result.area.error is not None
+    assert result.area.error.error_code == "upstream_unavailable"
+    assert result.keyword.status == "success"
+    assert result.keyword.returned_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_suggestions_empty_query():
+    """Test combined suggestions report an error when both lookups fail"""
+    result = await tabelog_get_suggestions(query="   ")
+
+    assert result.status == "error"
+    assert result.error is not None
+    assert result.error.error_code == "invalid_parameters"
+    assert result.area.status == "error"
+    assert result.keyword.status == "error"
+
+
 # ============================================================================
 # Integration-style Tests (verify tool interactions)
 # ============================================================================
 
 
 @pytest.mark.asyncio
-async def test_workflow_cuisine_validation():
+async def test_workflow_cuisine_validation(cuisines):
     """Test recommended workflow: list cuisines → validate → search"""
-    # Step 1: List cuisines
-    cuisines = await tabelog_list_cuisines()
+    # Step 1: List cuisines (shared session result)
     cuisine_names = [c.name for c in cuisines.items]
 
     # Step 2: Verify user's cuisine is in the list
@@ -896,44 +962,31 @@ async def test_workflow_cuisine_validation():
 
 
 @pytest.mark.asyncio
-async def test_workflow_area_validation(sample_area_suggestions, sample_restaurants):
+async def test_workflow_area_validation(sample_area_suggestions, success_response, area_suggestions_mock, search_mock):
     """Test recommended workflow: get area suggestions → search"""
     # Step 1: Get area suggestions
-    with patch(
-        "gurume.server.get_area_suggestions_async",
-        new_callable=AsyncMock,
-    ) as mock_area:
-        mock_area.return_value = sample_area_suggestions
-        area_suggestions = await tabelog_get_area_suggestions(query="東京")
+    area_suggestions_mock.return_value = sample_area_suggestions
+    area_suggestions = await tabelog_get_area_suggestions(query="東京")
 
     # Step 2: Select best area suggestion
     selected_area = area_suggestions.items[0].name  # "東京都"
     assert selected_area == "東京都"
 
     # Step 3: Search with validated area
-    mock_response = SearchResponse(
-        status=SearchStatus.SUCCESS,
-        restaurants=sample_restaurants,
-        meta=None,
-    )
-
-    with patch("gurume.server.SearchRequest.search", new_callable=AsyncMock) as mock_search:
-        mock_search.return_value = mock_response
-        results = await tabelog_search_restaurants(area=selected_area)
+    search_mock.return_value = success_response
+    results = await tabelog_search_restaurants(area=selected_area)
 
     assert len(results.items) == 2
 
 
 @pytest.mark.asyncio
-async def test_workflow_keyword_to_cuisine(sample_keyword_suggestions, sample_restaurants):
+async def test_workflow_keyword_to_cuisine(
+    sample_keyword_suggestions, success_response, keyword_suggestions_mock, search_mock
+):
     """Test recommended workflow: keyword suggestions → detect Genre2 → search with cuisine"""
     # Step 1: Get keyword suggestions
-    with patch(
-        "gurume.server.get_keyword_suggestions_async",
-        new_callable=AsyncMock,
-    ) as mock_keyword:
-        mock_keyword.return_value = sample_keyword_suggestions
-        keyword_suggestions = await tabelog_get_keyword_suggestions(query="すき")
+    keyword_suggestions_mock.return_value = sample_keyword_suggestions
+    keyword_suggestions = await tabelog_get_keyword_suggestions(query="すき")
 
     # Step 2: Identify Genre2 suggestions (cuisine types)
     genre_suggestions = [s for s in keyword_suggestions.items if s.datatype == "Genre2"]
@@ -941,15 +994,8 @@ async def test_workflow_keyword_to_cuisine(sample_keyword_suggestions, sample_re
     selected_cuisine = genre_suggestions[0].name  # "すき焼き"
 
     # Step 3: Search using cuisine parameter (not keyword)
-    mock_response = SearchResponse(
-        status=SearchStatus.SUCCESS,
-        restaurants=sample_restaurants,
-        meta=None,
-    )
-
-    with patch("gurume.server.SearchRequest.search", new_callable=AsyncMock) as mock_search:
-        mock_search.return_value = mock_response
-        results = await tabelog_search_restaurants(cuisine=selected_cuisine)
+    search_mock.return_value = success_response
+    results = await tabelog_search_restaurants(cuisine=selected_cuisine)
 
     assert len(results.items) == 2
 
@@ -1013,23 +1059,16 @@ async def test_mcp_tool_schema_exposes_detail_constraints():
 
 
 @pytest.mark.asyncio
-async def test_mcp_call_tool_returns_structured_envelope(sample_restaurants):
+async def test_mcp_call_tool_returns_structured_envelope(success_response, search_mock):
     """Test calling the tool through FastMCP returns the structured envelope"""
-    mock_response = SearchResponse(
-        status=SearchStatus.SUCCESS,
-        restaurants=sample_restaurants,
-        meta=None,
+    search_mock.return_value = success_response
+    content, structured = await mcp.call_tool(
+        "tabelog_search_restaurants",
+        {"area": "東京", "cuisine": "寿司", "limit": 5, "page": 2},
     )
 
-    with patch("gurume.server.SearchRequest.search", new_callable=AsyncMock) as mock_search:
-        mock_search.return_value = mock_response
-        content, structured = await mcp.call_tool(
-            "tabelog_search_restaurants",
-            {"area": "東京", "cuisine": "寿司", "limit": 5, "page": 2},
-        )
-
     structured_data = cast(dict[str, Any], structured)
-    assert mock_search.await_count == 1
+    assert search_mock.await_count == 1
     assert content
     assert structured_data["status"] == "success"
     assert structured_data["returned_count"] == 2
@@ -1040,20 +1079,21 @@ async def test_mcp_call_tool_returns_structured_envelope(sample_restaurants):
 
 
 @pytest.mark.asyncio
-async def test_mcp_call_detail_tool_returns_structured_data(sample_restaurant_detail):
+async def test_mcp_call_detail_tool_returns_structured_data(sample_restaurant_detail, monkeypatch):
     """Test calling the detail tool through FastMCP returns structured content"""
-    with patch("gurume.server.RestaurantDetailRequest") as mock_request_class:
-        mock_request = mock_request_class.return_value
-        mock_request.fetch = AsyncMock(return_value=sample_restaurant_detail)
-
-        content, structured = await mcp.call_tool(
-            "tabelog_get_restaurant_details",
-            {
-                "restaurant_url": "https://tabelog.com/tokyo/A1301/A130101/13000001/",
-                "max_review_pages": 2,
-                "fetch_courses": False,
-            },
-        )
+    mock_request_class = MagicMock()
+    monkeypatch.setattr("gurume.server.RestaurantDetailRequest", mock_request_class)
+    mock_request = mock_request_class.return_value
+    mock_request.fetch = AsyncMock(return_value=sample_restaurant_detail)
+
+    content, structured = await mcp.call_tool(
+        "tabelog_get_restaurant_details",
+        {
+            "restaurant_url": "https://tabelog.com/tokyo/A1301/A130101/13000001/",
+            "max_review_pages": 2,
+            "fetch_courses": False,
+        },
+    )
 
     structured_data = cast(dict[str, Any], structured)
     assert content
@@ -1107,42 +1147,45 @@ async def test_mcp_call_area_suggestions_returns_structured_error_for_empty_quer
 class TestRunTransport:
     """Test the entry point honors transport flags."""
 
-    def test_stdio_default_does_not_mutate_settings(self):
+    def test_stdio_default_does_not_mutate_settings(self, monkeypatch):
         from gurume import server
 
         original_host = server.mcp.settings.host
         original_port = server.mcp.settings.port
 
-        with patch.object(server.mcp, "run") as mock_mcp_run:
-            server.run()
-            mock_mcp_run.assert_called_once_with(transport="stdio")
+        mock_mcp_run = MagicMock()
+        monkeypatch.setattr(server.mcp, "run", mock_mcp_run)
+        server.run()
+        mock_mcp_run.assert_called_once_with(transport="stdio")
 
         # stdio must NOT mutate HTTP settings
         assert server.mcp.settings.host == original_host
         assert server.mcp.settings.port == original_port
 
-    def test_streamable_http_mutates_settings_and_runs(self):
+    def test_streamable_http_mutates_settings_and_runs(self, monkeypatch):
         from gurume import server
 
-        with patch.object(server.mcp, "run") as mock_mcp_run:
-            server.run(
-                transport="streamable-http",
-                host="0.0.0.0",
-                port=9001,
-                path="/api/mcp",
-            )
-            mock_mcp_run.assert_called_once_with(transport="streamable-http")
+        mock_mcp_run = MagicMock()
+        monkeypatch.setattr(server.mcp, "run", mock_mcp_run)
+        server.run(
+            transport="streamable-http",
+            host="0.0.0.0",
+            port=9001,
+            path="/api/mcp",
+        )
+        mock_mcp_run.assert_called_once_with(transport="streamable-http")
 
         assert server.mcp.settings.host == "0.0.0.0"
         assert server.mcp.settings.port == 9001
         assert server.mcp.settings.streamable_http_path == "/api/mcp"
 
-    def test_sse_sets_sse_path(self):
+    def test_sse_sets_sse_path(self, monkeypatch):
         from gurume import server
 
-        with patch.object(server.mcp, "run") as mock_mcp_run:
-            server.run(transport="sse", host="127.0.0.1", port=8765, path="/events")
-            mock_mcp_run.assert_called_once_with(transport="sse")
+        mock_mcp_run = MagicMock()
+        monkeypatch.setattr(server.mcp, "run", mock_mcp_run)
+        server.run(transport="sse", host="127.0.0.1", port=8765, path="/events")
+        mock_mcp_run.assert_called_once_with(transport="sse")
 
         assert server.mcp.settings.host == "127.0.0.1"
         assert server.mcp.settings.port == 8765
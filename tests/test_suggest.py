@@ -1,26 +1,77 @@
 """Tests for suggestion API (area and keyword suggestions)"""
 
-from unittest.mock import AsyncMock
+import asyncio
+import dataclasses
+from typing import Any
 from unittest.mock import Mock
-from unittest.mock import patch
 
 import httpx
 import pytest
 
+from gurume.http_client import aclose_async_client
+from gurume.http_client import get_async_client
+from gurume.suggest import SUGGEST_TIMEOUT
+from gurume.suggest import TYPEAHEAD_TIMEOUT
 from gurume.suggest import AreaSuggestion
 from gurume.suggest import KeywordSuggestion
+from gurume.suggest import SuggestionSession
 from gurume.suggest import TabelogSuggestUnavailableError
+from gurume.suggest import _get_client
 from gurume.suggest import get_area_suggestions
 from gurume.suggest import get_area_suggestions_async
 from gurume.suggest import get_keyword_suggestions
 from gurume.suggest import get_keyword_suggestions_async
 
+# Error-path tests only check that failures are swallowed, so they can raise shared instances
+_HTTP_ERROR = httpx.HTTPStatusError("404 Not Found", request=Mock(), response=Mock())
+_CONNECT_ERROR = httpx.ConnectError("Connection failed")
+
+
+class _FakeSuggestClient:
+    """Stand-in for the shared async client used by the async suggestion helpers"""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self._response: Mock | None = None
+        self._error: Exception | None = None
+
+    def set_response(self, json_data: Any) -> None:
+        response = Mock()
+        response.json.return_value = json_data
+        self._response, self._error = response, None
+
+    def set_error(self, error: Exception) -> None:
+        self._error = error
+
+    async def get(self, **kwargs: Any) -> Mock | None:
+        self.calls.append(kwargs)
+        if self._error is not None:
+            raise self._error
+        return self._response
+
+
 # ============================================================================
 # Test Data Fixtures
 # ============================================================================
 
 
 @pytest.fixture
+def suggest_client(monkeypatch):
+    """Route the async suggestion helpers to a fake client for one test"""
+    client = _FakeSuggestClient()
+    monkeypatch.setattr("gurume.suggest._get_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def httpx_get(monkeypatch):
+    """Replace httpx.get with a Mock; tests set its return_value or side_effect"""
+    mock = Mock()
+    monkeypatch.setattr("httpx.get", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
 def sample_area_response():
     """Sample API response for area suggestions"""
     return [
@@ -51,7 +102,7 @@ def sample_area_response():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_keyword_response():
     """Sample API response for keyword suggestions"""
     return [
@@ -87,38 +138,39 @@ def sample_keyword_response():
 # ============================================================================
 
 
-def test_get_area_suggestions_success(sample_area_response):
+def test_get_area_suggestions_success(sample_area_response, httpx_get):
     """Test successful area suggestions retrieval"""
     mock_response = Mock()
     mock_response.json.return_value = sample_area_response
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response) as mock_get:
-        results = get_area_suggestions(query="東京")
+    httpx_get.return_value = mock_response
+    results = get_area_suggestions(query="東京")
 
-        # Verify results
-        assert len(results) == 3
-        assert isinstance(results[0], AreaSuggestion)
+    # Verify results
+    assert len(results) == 3
+    assert isinstance(results[0], AreaSuggestion)
 
-        # First suggestion
-        assert results[0].name == "東京都"
-        assert results[0].datatype == "AddressMaster"
-        assert results[0].id_in_datatype == 13
-        assert results[0].lat == 35.6895
-        assert results[0].lng == 139.6917
+    # First suggestion
+    assert results[0].name == "東京都"
+    assert results[0].datatype == "AddressMaster"
+    assert results[0].id_in_datatype == 13
+    assert results[0].lat == 35.6895
+    assert results[0].lng == 139.6917
 
-        # Second suggestion
-        assert results[1].name == "渋谷駅"
-        assert results[1].datatype == "RailroadStation"
+    # Second suggestion
+    assert results[1].name == "渋谷駅"
+    assert results[1].datatype == "RailroadStation"
 
-        # Third suggestion
-        assert results[2].name == "新宿区"
+    # Third suggestion
+    assert results[2].name == "新宿区"
 
-        # Verify API was called correctly
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
-        assert call_args.kwargs["params"] == {"sa": "東京"}
-        assert "User-Agent" in call_args.kwargs["headers"]
+    # Verify API was called correctly
+    httpx_get.assert_called_once()
+    call_args = httpx_get.call_args
+    assert call_args.kwargs["params"] == {"sa": "東京"}
+    assert "User-Agent" in call_args.kwargs["headers"]
+    assert call_args.kwargs["headers"]["Accept"] == "application/json"
 
 
 def test_get_area_suggestions_empty_query():
@@ -127,63 +179,61 @@ def test_get_area_suggestions_empty_query():
     assert get_area_suggestions(query="   ") == []
 
 
-def test_get_area_suggestions_strips_whitespace(sample_area_response):
+def test_get_area_suggestions_strips_whitespace(sample_area_response, httpx_get):
     """Test that query whitespace is stripped"""
     mock_response = Mock()
     mock_response.json.return_value = sample_area_response
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response) as mock_get:
-        get_area_suggestions(query="  東京  ")
+    httpx_get.return_value = mock_response
+    get_area_suggestions(query="  東京  ")
 
-        call_args = mock_get.call_args
-        assert call_args.kwargs["params"] == {"sa": "東京"}
+    call_args = httpx_get.call_args
+    assert call_args.kwargs["params"] == {"sa": "東京"}
 
 
-def test_get_area_suggestions_http_error():
+def test_get_area_suggestions_http_error(httpx_get):
     """Test handling HTTP errors"""
-    with patch("httpx.get") as mock_get:
-        mock_get.side_effect = httpx.HTTPStatusError("404 Not Found", request=Mock(), response=Mock())
+    httpx_get.side_effect = _HTTP_ERROR
 
-        # Should return empty list on error
-        results = get_area_suggestions(query="東京")
-        assert results == []
+    # Should return empty list on error
+    results = get_area_suggestions(query="東京")
+    assert results == []
 
 
-def test_get_area_suggestions_network_error():
+def test_get_area_suggestions_network_error(httpx_get):
     """Test handling network errors"""
-    with patch("httpx.get") as mock_get:
-        mock_get.side_effect = httpx.ConnectError("Connection failed")
+    httpx_get.side_effect = _CONNECT_ERROR
 
-        # Should return empty list on error
-        results = get_area_suggestions(query="東京")
-        assert results == []
+    # Should return empty list on error
+    results = get_area_suggestions(query="東京")
+    assert results == []
 
 
-def test_get_area_suggestions_json_error():
+def test_get_area_suggestions_json_error(httpx_get):
     """Test handling JSON parsing errors"""
     mock_response = Mock()
     mock_response.json.side_effect = ValueError("Invalid JSON")
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response):
-        # Should return empty list on JSON error
-        results = get_area_suggestions(query="東京")
-        assert results == []
+    httpx_get.return_value = mock_response
+    # Should return empty list on JSON error
+    results = get_area_suggestions(query="東京")
+    assert results == []
 
 
-def test_get_area_suggestions_empty_response():
+def test_get_area_suggestions_empty_response(httpx_get):
     """Test with empty API response"""
     mock_response = Mock()
     mock_response.json.return_value = []
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response):
-        results = get_area_suggestions(query="東京")
-        assert results == []
+    httpx_get.return_value = mock_response
+    results = get_area_suggestions(query="東京")
+    assert results == []
 
 
-def test_get_area_suggestions_missing_fields():
+def test_get_area_suggestions_missing_fields(httpx_get):
     """Test handling responses with missing fields"""
     mock_response = Mock()
     mock_response.json.return_value = [
@@ -194,16 +244,27 @@ def test_get_area_suggestions_missing_fields():
     ]
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response):
-        results = get_area_suggestions(query="東京")
+    httpx_get.return_value = mock_response
+    results = get_area_suggestions(query="東京")
 
-        # Should use defaults for missing fields
-        assert len(results) == 1
-        assert results[0].name == "東京都"
-        assert results[0].datatype == ""
-        assert results[0].id_in_datatype == 0
-        assert results[0].lat is None
-        assert results[0].lng is None
+    # Should use defaults for missing fields
+    assert len(results) == 1
+    assert results[0].name == "東京都"
+    assert results[0].datatype == ""
+    assert results[0].id_in_datatype == 0
+    assert results[0].lat is None
+    assert results[0].lng is None
+
+
+def test_get_keyword_suggestions_skips_non_object_entries(httpx_get):
+    """Entries that are not JSON objects are dropped without losing the rest"""
+    mock_response = Mock()
+    mock_response.json.return_value = ["すき焼き", None, {"name": "和田金", "datatype": "Restaurant"}]
+    httpx_get.return_value = mock_response
+
+    results = get_keyword_suggestions(query="すき")
+
+    assert [r.name for r in results] == ["和田金"]
 
 
 # ============================================================================
@@ -212,30 +273,40 @@ def test_get_area_suggestions_missing_fields():
 
 
 @pytest.mark.asyncio
-async def test_get_area_suggestions_async_success(sample_area_response):
+async def test_get_area_suggestions_async_success(sample_area_response, suggest_client):
     """Test successful async area suggestions retrieval"""
-    mock_response = Mock()
-    mock_response.json.return_value = sample_area_response
-    mock_response.raise_for_status = Mock()
+    suggest_client.set_response(sample_area_response)
+    results = await get_area_suggestions_async(query="東京")
+
+    # Verify results
+    assert len(results) == 3
+    assert isinstance(results[0], AreaSuggestion)
+    assert results[0].name == "東京都"
+    assert results[0].datatype == "AddressMaster"
+    assert results[1].name == "渋谷駅"
+    assert results[2].name == "新宿区"
 
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
+    # Verify API was called
+    assert len(suggest_client.calls) == 1
 
-    with patch("httpx.AsyncClient", return_value=mock_client):
-        results = await get_area_suggestions_async(query="東京")
 
-        # Verify results
-        assert len(results) == 3
-        assert isinstance(results[0], AreaSuggestion)
-        assert results[0].name == "東京都"
-        assert results[0].datatype == "AddressMaster"
-        assert results[1].name == "渋谷駅"
-        assert results[2].name == "新宿区"
+@pytest.mark.asyncio
+async def test_async_suggestions_use_shared_client():
+    """Async suggestions reuse the pooled client for the running loop"""
+    try:
+        assert _get_client() is get_async_client()
+    finally:
+        await aclose_async_client()
+
+
+@pytest.mark.asyncio
+async def test_get_area_suggestions_async_forwards_request_timeout(sample_area_response, suggest_client):
+    """The per-call timeout is passed to the shared client's request"""
+    suggest_client.set_response(sample_area_response)
+
+    await get_area_suggestions_async(query="東京", request_timeout=3.0)
 
-        # Verify API was called
-        mock_client.get.assert_called_once()
+    assert suggest_client.calls[0]["timeout"] == 3.0
 
 
 @pytest.mark.asyncio
@@ -246,16 +317,11 @@ async def test_get_area_suggestions_async_empty_query():
 
 
 @pytest.mark.asyncio
-async def test_get_area_suggestions_async_http_error():
+async def test_get_area_suggestions_async_http_error(suggest_client):
     """Test async handling HTTP errors"""
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(side_effect=httpx.HTTPStatusError("404", request=Mock(), response=Mock()))
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-
-    with patch("httpx.AsyncClient", return_value=mock_client):
-        results = await get_area_suggestions_async(query="東京")
-        assert results == []
+    suggest_client.set_error(_HTTP_ERROR)
+    results = await get_area_suggestions_async(query="東京")
+    assert results == []
 
 
 # ============================================================================
@@ -263,40 +329,40 @@ async def test_get_area_suggestions_async_http_error():
 # ============================================================================
 
 
-def test_get_keyword_suggestions_success(sample_keyword_response):
+def test_get_keyword_suggestions_success(sample_keyword_response, httpx_get):
     """Test successful keyword suggestions retrieval"""
     mock_response = Mock()
     mock_response.json.return_value = sample_keyword_response
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response) as mock_get:
-        results = get_keyword_suggestions(query="すき")
+    httpx_get.return_value = mock_response
+    results = get_keyword_suggestions(query="すき")
 
-        # Verify results
-        assert len(results) == 3
-        assert isinstance(results[0], KeywordSuggestion)
+    # Verify results
+    assert len(results) == 3
+    assert isinstance(results[0], KeywordSuggestion)
 
-        # Genre2 suggestion
-        assert results[0].name == "すき焼き"
-        assert results[0].datatype == "Genre2"
-        assert results[0].id_in_datatype == 107
-        assert results[0].lat is None
-        assert results[0].lng is None
+    # Genre2 suggestion
+    assert results[0].name == "すき焼き"
+    assert results[0].datatype == "Genre2"
+    assert results[0].id_in_datatype == 107
+    assert results[0].lat is None
+    assert results[0].lng is None
 
-        # Restaurant suggestion
-        assert results[1].name == "和田金"
-        assert results[1].datatype == "Restaurant"
-        assert results[1].id_in_datatype == 24000123
+    # Restaurant suggestion
+    assert results[1].name == "和田金"
+    assert results[1].datatype == "Restaurant"
+    assert results[1].id_in_datatype == 24000123
 
-        # DetailCondition suggestion
-        assert results[2].name == "すき焼き ランチ"
-        assert results[2].datatype == "Genre2 DetailCondition"
+    # DetailCondition suggestion
+    assert results[2].name == "すき焼き ランチ"
+    assert results[2].datatype == "Genre2 DetailCondition"
 
-        # Verify API was called correctly
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
-        assert call_args.kwargs["params"] == {"sk": "すき"}
-        assert "User-Agent" in call_args.kwargs["headers"]
+    # Verify API was called correctly
+    httpx_get.assert_called_once()
+    call_args = httpx_get.call_args
+    assert call_args.kwargs["params"] == {"sk": "すき"}
+    assert "User-Agent" in call_args.kwargs["headers"]
 
 
 def test_get_keyword_suggestions_empty_query():
@@ -305,48 +371,46 @@ def test_get_keyword_suggestions_empty_query():
     assert get_keyword_suggestions(query="   ") == []
 
 
-def test_get_keyword_suggestions_strips_whitespace(sample_keyword_response):
+def test_get_keyword_suggestions_strips_whitespace(sample_keyword_response, httpx_get):
     """Test that query whitespace is stripped"""
     mock_response = Mock()
     mock_response.json.return_value = sample_keyword_response
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response) as mock_get:
-        get_keyword_suggestions(query="  すき  ")
+    httpx_get.return_value = mock_response
+    get_keyword_suggestions(query="  すき  ")
 
-        call_args = mock_get.call_args
-        assert call_args.kwargs["params"] == {"sk": "すき"}
+    call_args = httpx_get.call_args
+    assert call_args.kwargs["params"] == {"sk": "すき"}
 
 
-def test_get_keyword_suggestions_http_error():
+def test_get_keyword_suggestions_http_error(httpx_get):
     """Test handling HTTP errors"""
-    with patch("httpx.get") as mock_get:
-        mock_get.side_effect = httpx.HTTPStatusError("500 Server Error", request=Mock(), response=Mock())
+    httpx_get.side_effect = _HTTP_ERROR
 
-        # Should return empty list on error
-        results = get_keyword_suggestions(query="すき")
-        assert results == []
+    # Should return empty list on error
+    results = get_keyword_suggestions(query="すき")
+    assert results == []
 
 
-def test_get_keyword_suggestions_network_error():
+def test_get_keyword_suggestions_network_error(httpx_get):
     """Test handling network errors"""
-    with patch("httpx.get") as mock_get:
-        mock_get.side_effect = httpx.TimeoutException("Request timeout")
+    httpx_get.side_effect = httpx.TimeoutException("Request timeout")
 
-        # Should return empty list on error
-        results = get_keyword_suggestions(query="すき")
-        assert results == []
+    # Should return empty list on error
+    results = get_keyword_suggestions(query="すき")
+    assert results == []
 
 
-def test_get_keyword_suggestions_empty_response():
+def test_get_keyword_suggestions_empty_response(httpx_get):
     """Test with empty API response"""
     mock_response = Mock()
     mock_response.json.return_value = []
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response):
-        results = get_keyword_suggestions(query="すき")
-        assert results == []
+    httpx_get.return_value = mock_response
+    results = get_keyword_suggestions(query="すき")
+    assert results == []
 
 
 # ============================================================================
@@ -355,31 +419,22 @@ def test_get_keyword_suggestions_empty_response():
 
 
 @pytest.mark.asyncio
-async def test_get_keyword_suggestions_async_success(sample_keyword_response):
+async def test_get_keyword_suggestions_async_success(sample_keyword_response, suggest_client):
     """Test successful async keyword suggestions retrieval"""
-    mock_response = Mock()
-    mock_response.json.return_value = sample_keyword_response
-    mock_response.raise_for_status = Mock()
+    suggest_client.set_response(sample_keyword_response)
+    results = await get_keyword_suggestions_async(query="すき")
 
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
+    # Verify results
+    assert len(results) == 3
+    assert isinstance(results[0], KeywordSuggestion)
+    assert results[0].name == "すき焼き"
+    assert results[0].datatype == "Genre2"
+    assert results[1].name == "和田金"
+    assert results[1].datatype == "Restaurant"
+    assert results[2].name == "すき焼き ランチ"
 
-    with patch("httpx.AsyncClient", return_value=mock_client):
-        results = await get_keyword_suggestions_async(query="すき")
-
-        # Verify results
-        assert len(results) == 3
-        assert isinstance(results[0], KeywordSuggestion)
-        assert results[0].name == "すき焼き"
-        assert results[0].datatype == "Genre2"
-        assert results[1].name == "和田金"
-        assert results[1].datatype == "Restaurant"
-        assert results[2].name == "すき焼き ランチ"
-
-        # Verify API was called
-        mock_client.get.assert_called_once()
+    # Verify API was called
+    assert len(suggest_client.calls) == 1
 
 
 @pytest.mark.asyncio
@@ -390,16 +445,196 @@ async def test_get_keyword_suggestions_async_empty_query():
 
 
 @pytest.mark.asyncio
-async def test_get_keyword_suggestions_async_http_error():
+async def test_get_keyword_suggestions_async_caches_repeated_query(sample_keyword_response, suggest_client):
+    """A repeated query is served from the response cache without a second request"""
+    suggest_client.set_response(sample_keyword_response)
+
+    first = await get_keyword_suggestions_async(query="すき")
+    second = await get_keyword_suggestions_async(query=" すき ")
+
+    assert len(suggest_client.calls) == 1
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_get_keyword_suggestions_async_use_cache_false_refetches(sample_keyword_response, suggest_client):
+    """use_cache=False always hits the endpoint"""
+    suggest_client.set_response(sample_keyword_response)
+
+    await get_keyword_suggestions_async(query="すき", use_cache=False)
+    await get_keyword_suggestions_async(query="すき", use_cache=False)
+
+    assert len(suggest_client.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_keyword_suggestions_async_shares_inflight_request(
+    sample_keyword_response, suggest_client, monkeypatch
+):
+    """Concurrent identical queries share one request"""
+    suggest_client.set_response(sample_keyword_response)
+    release = asyncio.Event()
+    fake_get = suggest_client.get
+
+    async def slow_get(**kwargs):
+        await release.wait()
+        return await fake_get(**kwargs)
+
+    monkeypatch.setattr(suggest_client, "get", slow_get)
+
+    tasks = [asyncio.create_task(get_keyword_suggestions_async(query="すき")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert len(suggest_client.calls) == 1
+    assert results[0] == results[1] == results[2]
+    assert len(results[0]) == len(sample_keyword_response)
+
+
+@pytest.mark.asyncio
+async def test_get_keyword_suggestions_async_empty_query_skips_client(monkeypatch):
+    """Blank queries return before the shared client is looked up"""
+    get_client = Mock()
+    monkeypatch.setattr("gurume.suggest._get_client", get_client)
+
+    assert await get_keyword_suggestions_async(query="   ") == []
+    get_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_keyword_suggestions_async_http_error(suggest_client):
     """Test async handling HTTP errors"""
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(side_effect=httpx.HTTPStatusError("500", request=Mock(), response=Mock()))
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
+    suggest_client.set_error(_HTTP_ERROR)
+    results = await get_keyword_suggestions_async(query="すき")
+    assert results == []
+
+
+@pytest.mark.asyncio
+async def test_get_keyword_suggestions_async_timeout(suggest_client):
+    """A slow upstream read falls back to an empty list"""
+    suggest_client.set_error(httpx.ReadTimeout("slow"))
+
+    assert await get_keyword_suggestions_async(query="すき") == []
+
+
+@pytest.mark.asyncio
+async def test_get_keyword_suggestions_async_uses_default_timeout(sample_keyword_response, suggest_client):
+    """Direct async lookups keep the regular 10s timeout"""
+    suggest_client.set_response(sample_keyword_response)
+
+    await get_keyword_suggestions_async(query="すき")
+
+    assert suggest_client.calls[0]["timeout"] == SUGGEST_TIMEOUT == 10.0
+
+
+# ============================================================================
+# Test SuggestionSession (typeahead cancellation)
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_suggestion_session_cancels_superseded_query():
+    """A newer query cancels the pending one, which resolves to an empty list"""
+    first_started = asyncio.Event()
+    release_first = asyncio.Event()
+    cancelled: list[str] = []
+
+    async def fetch(query: str, *, request_timeout: float | httpx.Timeout) -> list[str]:
+        if query == "す":
+            first_started.set()
+            try:
+                await release_first.wait()
+            except asyncio.CancelledError:
+                cancelled.append(query)
+                raise
+        return [f"{query}焼き"]
+
+    session = SuggestionSession(fetch)
+    first = asyncio.create_task(session.query("す"))
+    await first_started.wait()
+
+    second = await session.query("すき")
+
+    assert await first == []
+    assert second == ["すき焼き"]
+    assert cancelled == ["す"]
+
+
+@pytest.mark.asyncio
+async def test_suggestion_session_aborts_superseded_request(sample_keyword_response, suggest_client, monkeypatch):
+    """A superseded lookup cancels its HTTP request instead of letting it finish"""
+    suggest_client.set_response(sample_keyword_response)
+    first_sent = asyncio.Event()
+    aborted: list[str] = []
+    fake_get = suggest_client.get
+
+    async def get(**kwargs):
+        if kwargs["params"] == {"sk": "す"}:
+            first_sent.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                aborted.append("す")
+                raise
+        return await fake_get(**kwargs)
+
+    monkeypatch.setattr(suggest_client, "get", get)
+
+    session = SuggestionSession(get_keyword_suggestions_async, debounce=0)
+    first = asyncio.create_task(session.query("す"))
+    await first_sent.wait()
+    second = await session.query("すき")
+
+    assert await first == []
+    assert len(second) == len(sample_keyword_response)
+    assert aborted == ["す"]
+
+
+@pytest.mark.asyncio
+async def test_suggestion_session_debounces_keystroke_burst(sample_keyword_response, suggest_client):
+    """Rapid queries within the debounce window send one request for the final prefix"""
+    suggest_client.set_response(sample_keyword_response)
+    session = SuggestionSession(get_keyword_suggestions_async, debounce=0.05)
 
-    with patch("httpx.AsyncClient", return_value=mock_client):
-        results = await get_keyword_suggestions_async(query="すき")
-        assert results == []
+    pending = []
+    for prefix in ("す", "すき"):
+        pending.append(asyncio.create_task(session.query(prefix)))
+        await asyncio.sleep(0.01)
+    final = await session.query("すき焼")
+
+    assert [await task for task in pending] == [[], []]
+    assert len(final) == 3
+    assert [call["params"] for call in suggest_client.calls] == [{"sk": "すき焼"}]
+
+
+@pytest.mark.asyncio
+async def test_suggestion_session_uses_typeahead_timeout(sample_keyword_response, suggest_client):
+    """Typeahead lookups through a session fail fast with the short timeout"""
+    suggest_client.set_response(sample_keyword_response)
+    session = SuggestionSession(get_keyword_suggestions_async, debounce=0)
+
+    await session.query("すき")
+
+    assert suggest_client.calls[0]["timeout"] == TYPEAHEAD_TIMEOUT
+    assert TYPEAHEAD_TIMEOUT.connect == 1.0
+
+
+@pytest.mark.asyncio
+async def test_suggestion_session_propagates_caller_cancellation():
+    """Cancelling the caller still raises instead of returning an empty list"""
+
+    async def fetch(query: str, *, request_timeout: float | httpx.Timeout) -> list[str]:
+        await asyncio.Event().wait()
+        return []
+
+    session = SuggestionSession(fetch)
+    task = asyncio.create_task(session.query("すき"))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
 
 
 # ============================================================================
@@ -407,6 +642,18 @@ async def test_get_keyword_suggestions_async_http_error():
 # ============================================================================
 
 
+def test_suggestions_are_slotted_and_frozen():
+    """Suggestions carry no per-instance __dict__ and are hashable value objects"""
+    area = AreaSuggestion(name="東京都", datatype="AddressMaster", id_in_datatype=13)
+    keyword = KeywordSuggestion(name="すき焼き", datatype="Genre2", id_in_datatype=107)
+
+    assert not hasattr(area, "__dict__")
+    assert not hasattr(keyword, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        area.name = "大阪府"  # type: ignore[misc]
+    assert len({keyword, KeywordSuggestion(name="すき焼き", datatype="Genre2", id_in_datatype=107)}) == 1
+
+
 def test_area_and_keyword_dataclass_compatibility():
     """Test that AreaSuggestion and KeywordSuggestion dataclasses work correctly"""
     # AreaSuggestion with all fields
@@ -453,59 +700,47 @@ def test_area_and_keyword_dataclass_compatibility():
 # ============================================================================
 
 
-def test_get_area_suggestions_raises_on_suggest_empty():
+def test_get_area_suggestions_raises_on_suggest_empty(httpx_get):
     """When Tabelog returns {'suggest_empty': true} the function must raise."""
     mock_response = Mock()
     mock_response.json.return_value = {"suggest_empty": True}
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response), pytest.raises(TabelogSuggestUnavailableError):
+    httpx_get.return_value = mock_response
+
+    with pytest.raises(TabelogSuggestUnavailableError):
         get_area_suggestions(query="東京")
 
 
-def test_get_keyword_suggestions_raises_on_suggest_empty():
+def test_get_keyword_suggestions_raises_on_suggest_empty(httpx_get):
     """Keyword endpoint must also raise on suggest_empty."""
     mock_response = Mock()
     mock_response.json.return_value = {"suggest_empty": True}
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response), pytest.raises(TabelogSuggestUnavailableError):
+    httpx_get.return_value = mock_response
+
+    with pytest.raises(TabelogSuggestUnavailableError):
         get_keyword_suggestions(query="すき")
 
 
 @pytest.mark.asyncio
-async def test_get_area_suggestions_async_raises_on_suggest_empty():
+async def test_get_area_suggestions_async_raises_on_suggest_empty(suggest_client):
     """Async area endpoint must propagate TabelogSuggestUnavailableError."""
-    mock_response = Mock()
-    mock_response.json.return_value = {"suggest_empty": True}
-    mock_response.raise_for_status = Mock()
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-
-    with patch("httpx.AsyncClient", return_value=mock_client), pytest.raises(TabelogSuggestUnavailableError):
+    suggest_client.set_response({"suggest_empty": True})
+    with pytest.raises(TabelogSuggestUnavailableError):
         await get_area_suggestions_async(query="東京")
 
 
 @pytest.mark.asyncio
-async def test_get_keyword_suggestions_async_raises_on_suggest_empty():
+async def test_get_keyword_suggestions_async_raises_on_suggest_empty(suggest_client):
     """Async keyword endpoint must propagate TabelogSuggestUnavailableError."""
-    mock_response = Mock()
-    mock_response.json.return_value = {"suggest_empty": True}
-    mock_response.raise_for_status = Mock()
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-
-    with patch("httpx.AsyncClient", return_value=mock_client), pytest.raises(TabelogSuggestUnavailableError):
+    suggest_client.set_response({"suggest_empty": True})
+    with pytest.raises(TabelogSuggestUnavailableError):
         await get_keyword_suggestions_async(query="すき")
 
 
-def test_get_area_suggestions_parses_prefecture_datatype():
+def test_get_area_suggestions_parses_prefecture_datatype(httpx_get):
     """Prefecture datatype responses must parse without error."""
     mock_response = Mock()
     mock_response.json.return_value = [
@@ -519,14 +754,14 @@ def test_get_area_suggestions_parses_prefecture_datatype():
     ]
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response):
-        results = get_area_suggestions(query="東京")
-        assert len(results) == 1
-        assert results[0].name == "東京都"
-        assert results[0].datatype == "Prefecture"
+    httpx_get.return_value = mock_response
+    results = get_area_suggestions(query="東京")
+    assert len(results) == 1
+    assert results[0].name == "東京都"
+    assert results[0].datatype == "Prefecture"
 
 
-def test_get_area_suggestions_parses_town_datatype():
+def test_get_area_suggestions_parses_town_datatype(httpx_get):
     """Town datatype responses must parse without error."""
     mock_response = Mock()
     mock_response.json.return_value = [
@@ -540,8 +775,8 @@ def test_get_area_suggestions_parses_town_datatype():
     ]
     mock_response.raise_for_status = Mock()
 
-    with patch("httpx.get", return_value=mock_response):
-        results = get_area_suggestions(query="三重")
-        assert len(results) == 1
-        assert results[0].name == "三重町"
-        assert results[0].datatype == "Town"
+    httpx_get.return_value = mock_response
+    results = get_area_suggestions(query="三重")
+    assert len(results) == 1
+    assert results[0].name == "三重町"
+    assert results[0].datatype == "Town"
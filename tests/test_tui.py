@@ -0,0 +1,105 @@
+"""Tests for the Textual TUI search and detail-panel state"""
+
+from typing import Any
+
+import pytest
+from textual.widgets import Input
+
+from gurume.restaurant import Restaurant
+from gurume.search import SearchResponse
+from gurume.search import SearchStatus
+from gurume.tui import SEARCH_DEBOUNCE_SECONDS
+from gurume.tui import ResultsTable
+from gurume.tui import TabelogApp
+
+
+@pytest.fixture
+def restaurants():
+    """Two restaurants returned by every faked search"""
+    return [
+        Restaurant(name="すし匠", url="https://tabelog.com/tokyo/A1301/A130101/13000001/", rating=4.5),
+        Restaurant(name="焼肉一番", url="https://tabelog.com/tokyo/A1304/A130401/13000002/", rating=4.2),
+    ]
+
+
+@pytest.fixture
+def search_calls(monkeypatch, restaurants):
+    """Replace SearchRequest.search with a fake that records each call"""
+    calls: list[dict[str, Any]] = []
+
+    async def fake_search(self, client=None, use_cache=True):
+        calls.append({"area": self.area, "keyword": self.keyword, "use_cache": use_cache})
+        return SearchResponse(status=SearchStatus.SUCCESS, restaurants=list(restaurants))
+
+    monkeypatch.setattr("gurume.tui.SearchRequest.search", fake_search)
+    return calls
+
+
+async def _search(app: TabelogApp, pilot, area: str = "銀座") -> None:
+    app.query_one("#area-input", Input).value = area
+    app.start_search()
+    await pilot.pause(SEARCH_DEBOUNCE_SECONDS * 2)
+    await app.workers.wait_for_complete()
+    await pilot.pause()
+
+
+async def _select_row(app: TabelogApp, pilot, row: int) -> None:
+    table = app.query_one("#results-table", ResultsTable)
+    table.focus()
+    table.move_cursor(row=row)
+    await pilot.press("enter")
+    await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_rapid_submissions_run_one_search(search_calls, monkeypatch):
+    """Several Enter presses within the debounce window start a single search"""
+    # Headless key presses are slower than a real burst, so widen the window to cover them.
+    monkeypatch.setattr("gurume.tui.SEARCH_DEBOUNCE_SECONDS", 1.0)
+    app = TabelogApp()
+    async with app.run_test() as pilot:
+        app.query_one("#area-input", Input).value = "銀座"
+        app.query_one("#area-input", Input).focus()
+        for _ in range(3):
+            await pilot.press("enter")
+        await pilot.pause(1.5)
+        await app.workers.wait_for_complete()
+
+    assert search_calls == [{"area": "銀座", "keyword": "", "use_cache": True}]
+
+
+@pytest.mark.asyncio
+async def test_new_search_resets_detail_memo(search_calls, restaurants):
+    """A new search clears the row and detail memo left by the previous selection"""
+    app = TabelogApp()
+    async with app.run_test() as pilot:
+        await _search(app, pilot)
+        await _select_row(app, pilot, 1)
+        assert app._last_cursor_row == 1
+        assert app._last_detail_url == restaurants[1].url
+
+        await _search(app, pilot, area="新宿")
+
+        assert len(search_calls) == 2
+        assert app._last_cursor_row == -1
+        assert app._last_detail_url is None
+        assert app._last_status is not None and app._last_status.startswith("找到 2 家餐廳")
+
+
+@pytest.mark.asyncio
+async def test_reselecting_row_after_status_rerenders_details(search_calls, restaurants):
+    """Selecting the same row again after a status message brings the details back"""
+    app = TabelogApp()
+    async with app.run_test() as pilot:
+        await _search(app, pilot)
+        await _select_row(app, pilot, 0)
+        assert app._last_detail_url == restaurants[0].url
+
+        app._set_status("請輸入地區或關鍵字")
+        assert app._last_detail_url is None
+
+        await _select_row(app, pilot, 0)
+
+        assert app._last_detail_url == restaurants[0].url
+        assert app._last_status is None
+        assert app._last_cursor_row == 0